@@ -5,6 +5,7 @@
 Utility functions to manipulate dopesheet elements.
 """
 
+import bisect
 from enum import Flag, auto
 import sys
 from typing import Optional
@@ -148,38 +149,22 @@ def gp_compute_list_of_frames_to_duplicate(
     if len(gpl.frames) == 0:
         return []
 
-    new_frames_list = []
-
-    i = 0
-    # If the target is before the first key, skip it
-    while frame_numbers[i] < gpl.frames[0].frame_number:
-        i += 1
-
-    j = 0
-    while i < len(frame_numbers):
-        target = frame_numbers[i]
-        current_key = gpl.frames[j].frame_number
+    # Snapshot the keyframes once: the search below then runs on plain ints
+    # instead of going through RNA collection lookups for every comparison.
+    keyframes = gpl.frames[:]
+    keyframe_numbers = [gpf.frame_number for gpf in keyframes]
 
+    new_frames_list = []
+    for target in frame_numbers:
+        # Index of the last keyframe at or before the target.
+        idx = bisect.bisect_right(keyframe_numbers, target) - 1
+        # If the target is before the first key, skip it
+        if idx < 0:
+            continue
         # If there is already a keyframe at the target, skip it
-        if target == current_key:
-            i += 1
+        if keyframe_numbers[idx] == target:
             continue
-
-        # target > current:
-        if j + 1 < len(gpl.frames):
-            next_key = gpl.frames[j + 1].frame_number
-
-            # If the next key is after the target, copy the current key and got to the next target
-            if target < next_key:
-                new_frames_list.append((gpl.frames[j], target))
-                i += 1
-            # Else go to the next key
-            else:
-                j += 1
-        else:
-            # If this is the last key, copy it and got to the next target
-            new_frames_list.append((gpl.frames[j], target))
-            i += 1
+        new_frames_list.append((keyframes[idx], target))
 
     return new_frames_list
 
@@ -220,7 +205,11 @@ def shift_keyframes(
     :param adjust_offset: Whether to adjust offset to satisfy `frame_min` constraint
     :returns: Whether keyframes were shifted
     """
-    min_value = min(keyframes, key=lambda x: x.frame_number).frame_number
+    # A null offset can never shift anything: skip the frame scans entirely.
+    if offset == 0:
+        return False
+
+    min_value = min(keyframe.frame_number for keyframe in keyframes)
     # If keyframes contains keys below frame_min, return
     if min_value < frame_min:
         return False
@@ -234,6 +223,8 @@ def shift_keyframes(
         else:
             return False
 
+    # The adjustment above can null the offset (keyframes already sitting at
+    # the minimum frame): nothing to move in that case either.
     if offset == 0:
         return False
 
@@ -264,6 +255,9 @@ def shift_gp_keyframes(
     :param only_selected_layers: Only affect selected layers
     :returns: The keyframes moved by this operation
     """
+    # A null offset cannot move anything: skip the keyframe collection.
+    if offset == 0:
+        return []
 
     # Get GP keyframes after frame_start
     keyframes = get_gp_keyframes(
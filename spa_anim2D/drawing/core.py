@@ -12,6 +12,14 @@ import mathutils
 msgbus_owner = object()
 
 
+def _object_ptr(obj: Optional[bpy.types.Object]) -> Optional[int]:
+    """Session pointer of `obj`, None if obj is None.
+
+    Comparing session pointers avoids the RNA equality dispatch of `==`.
+    """
+    return obj.as_pointer() if obj is not None else None
+
+
 def is_parented_to(obj: bpy.types.Object, other: bpy.types.Object) -> bool:
     """
     Returns whether `obj` is parented to `other`. This includes direct
@@ -23,17 +31,16 @@ def is_parented_to(obj: bpy.types.Object, other: bpy.types.Object) -> bool:
     """
     if not obj:
         return False
+    other_ptr = _object_ptr(other)
     # Test direct parent
-    if obj.parent == other:
+    if _object_ptr(obj.parent) == other_ptr:
         return True
     # Look for a CHILD_OF constraint with a matching target
-    constraint = next(
-        (c for c in obj.constraints if c.type == "CHILD_OF" and c.target == other),
-        None,
+    return any(
+        c.type == "CHILD_OF" and _object_ptr(c.target) == other_ptr
+        for c in obj.constraints
     )
 
-    return constraint is not None
-
 
 def set_parent(
     obj: bpy.types.Object, parent: bpy.types.Object, use_contraint: bool = False
@@ -49,8 +56,11 @@ def set_parent(
         constraint = obj.constraints.new(type="CHILD_OF")
         constraint.target = parent
     else:
+        # Read the parent matrix before assigning obj.parent: the assignment tags
+        # the dependency graph and re-reading obj.parent costs an extra RNA fetch.
+        parent_matrix = parent.matrix_world
         obj.parent = parent
-        obj.matrix_parent_inverse = obj.parent.matrix_world.inverted()
+        obj.matrix_parent_inverse = parent_matrix.inverted_safe()
 
 
 def clear_parent(obj: bpy.types.Object, parent: bpy.types.Object):
@@ -61,16 +71,23 @@ def clear_parent(obj: bpy.types.Object, parent: bpy.types.Object):
     :param obj: The object to consider.
     :param parent: The object to unparent from.
     """
-    if obj.parent == parent:
+    parent_ptr = _object_ptr(parent)
+    if _object_ptr(obj.parent) == parent_ptr:
         matrix = obj.matrix_world.copy()
         obj.parent = None
         obj.matrix_world = matrix
     else:
-        for c in (
-            c for c in obj.constraints if c.type == "CHILD_OF" and c.target == parent
-        ):
+        matching = [
+            c
+            for c in obj.constraints
+            if c.type == "CHILD_OF" and _object_ptr(c.target) == parent_ptr
+        ]
+        if matching:
+            # Save the world matrix once and restore it after removing all the
+            # matching constraints: a single depsgraph-triggering write.
             matrix = obj.matrix_world.copy()
-            obj.constraints.remove(c)
+            for c in matching:
+                obj.constraints.remove(c)
             obj.matrix_world = matrix
 
 
@@ -89,8 +106,8 @@ def create_gpencil_object(
     """
     # Store active mode and whether to restore it
     active_mode = context.mode
-    # Use getattr to handle active_object being None
-    restore_mode = getattr(context.active_object, "type", "") == "GPENCIL"
+    active_obj = context.active_object
+    restore_mode = active_obj is not None and active_obj.type == "GPENCIL"
 
     # Create new GP object
     gpd = bpy.data.grease_pencils.new(name=name)
@@ -100,10 +117,9 @@ def create_gpencil_object(
     context.view_layer.objects.active = gp
 
     # Create default layers and initial empty keyframes
-    layers = ("Fill", "Lines")
-    for layer_name in layers:
-        layer = gp.data.layers.new(name=layer_name)
-        layer.frames.new(frame_number=context.scene.frame_start)
+    frame_start = context.scene.frame_start
+    gpd.layers.new(name="Fill").frames.new(frame_number=frame_start)
+    gpd.layers.new(name="Lines").frames.new(frame_number=frame_start)
 
     # Restore previously active GP mode
     if restore_mode:
@@ -127,12 +143,16 @@ def orient_to_view(
     quat.rotate(view_matrix.inverted().to_quaternion())
     euler = quat.to_euler()
 
-    if axis[0]:
-        obj.rotation_euler.x = euler.x
-    if axis[1]:
-        obj.rotation_euler.y = euler.y
-    if axis[2]:
-        obj.rotation_euler.z = euler.z
+    if axis[0] and axis[1] and axis[2]:
+        # Common case: assign all axes with a single RNA write.
+        obj.rotation_euler = euler
+    else:
+        if axis[0]:
+            obj.rotation_euler.x = euler.x
+        if axis[1]:
+            obj.rotation_euler.y = euler.y
+        if axis[2]:
+            obj.rotation_euler.z = euler.z
 
     # Update matrix parent inverse if object is parented to preserve location
     if obj.parent:
@@ -181,11 +201,14 @@ def select_only(
     :param obj: The object to select.
     :param children: Whether to also select object's children.
     """
-    if not children and len(context.selected_objects) == 1 and obj.select_get():
+    # Cache the selection: selected_objects is a computed property that rebuilds
+    # its list on every access.
+    selected = context.selected_objects
+    if not children and len(selected) == 1 and obj in selected:
         return
 
     # Deselect currently selected objects.
-    for item in context.selected_objects:
+    for item in selected:
         item.select_set(False)
 
     # Select target object - and its children if the option is enabled.
@@ -195,19 +218,41 @@ def select_only(
             item.select_set(True)
 
 
+# Whether the msgbus subscription owned by `msgbus_owner` is currently active.
+_msgbus_subscribed = False
+
+
 @bpy.app.handlers.persistent
 def msgbus_subscribe(*args):
+    global _msgbus_subscribed
+    # Don't re-register the RNA subscription if it is still active
+    # (e.g: load_post firing when register() already subscribed).
+    if _msgbus_subscribed:
+        return
     bpy.msgbus.subscribe_rna(
         key=(bpy.types.LayerObjects, "active"),
         owner=msgbus_owner,
         args=(),
         notify=active_object_changed,
     )
+    _msgbus_subscribed = True
 
 
 @bpy.app.handlers.persistent
 def msgbus_unsubscribe(*args):
+    global _msgbus_subscribed
     bpy.msgbus.clear_by_owner(msgbus_owner)
+    _msgbus_subscribed = False
+
+
+# Maps grease pencil interaction modes to the matching data flag name.
+# e.g: PAINT_GPENCIL => is_stroke_paint_mode
+gp_stroke_mode_flags = {
+    "PAINT_GPENCIL": "is_stroke_paint_mode",
+    "SCULPT_GPENCIL": "is_stroke_sculpt_mode",
+    "WEIGHT_GPENCIL": "is_stroke_weight_mode",
+    "VERTEX_GPENCIL": "is_stroke_vertex_mode",
+}
 
 
 def set_gpencil_mode_safe(
@@ -221,6 +266,11 @@ def set_gpencil_mode_safe(
     :param gpencil: The grease pencil object to set the mode of
     :param mode: The mode to activate
     """
+    # Nothing to do if the object is already in the target mode.
+    # Avoids the context override and mode_set depsgraph flush entirely.
+    if gpencil.mode == mode:
+        return
+
     # Override context: "object.mode_set" uses view_layer's active object
     with context.temp_override(
         scene=context.window.scene,
@@ -232,26 +282,57 @@ def set_gpencil_mode_safe(
         # When that happens, switching to the mode fails.
         # If data flag for this mode is already activated, switch to the safe
         # 'EDIT_GPENCIL' mode first as a workaround to sync back the flags.
-        if mode not in ("OBJECT", "EDIT_GPENCIL"):
-            # Get short name for this mode to build data flag
-            # e.g: PAINT_GPENCIL => paint
-            mode_short = mode.split("_")[0].lower()
+        if flag := gp_stroke_mode_flags.get(mode):
             # Switch to edit mode first if data flags is activated
-            if getattr(gpencil.data, f"is_stroke_{mode_short}_mode", False):
+            if getattr(gpencil.data, flag, False):
                 bpy.ops.object.mode_set(mode="EDIT_GPENCIL")
         # Switch the object interaction mode
         bpy.ops.object.mode_set(mode=mode)
 
 
+# Latest active_gp_index value awaiting application by the debounce timer.
+# See `active_gp_index_update_callback` and `apply_pending_gp_index` for usage.
+_pending_gp_index: Optional[int] = None
+
+
 def active_gp_index_update_callback(scene: bpy.types.Scene, context: bpy.types.Context):
     """Callback on active scene.active_gp_index value change."""
+    global _pending_gp_index
+    # Coalesce rapid successive updates (e.g: multi-selection or script-driven
+    # writes) into a single trailing call: the expensive selection and
+    # mode-switch work only runs once, for the latest value.
+    _pending_gp_index = scene.active_gp_index
+
+    if bpy.app.background:
+        # NOTE: timer functions are not consumed in background mode,
+        #       apply the update immediately instead.
+        apply_pending_gp_index()
+    elif not bpy.app.timers.is_registered(apply_pending_gp_index):
+        bpy.app.timers.register(apply_pending_gp_index, first_interval=0.0)
+
+
+def apply_pending_gp_index():
+    """Apply the latest pending active_gp_index value (one-shot timer function)."""
+    global _pending_gp_index
+    if _pending_gp_index is None:
+        return None
+
+    context = bpy.context
+    # Timer functions can run without a window (e.g. during renders or file
+    # loads), and the selection/mode-switch helpers below need one to resolve
+    # their context members: keep the value pending and retry on a later
+    # tick. Background mode never has a window and applies synchronously.
+    if context.window is None and not bpy.app.background:
+        return 0.1
+
+    scene = context.scene
+    idx, _pending_gp_index = _pending_gp_index, None
+    objs = scene.objects
     # Discard invalid values
-    if context.scene.active_gp_index < 0 or context.scene.active_gp_index >= len(
-        context.scene.objects
-    ):
-        return
+    if idx < 0 or idx >= len(objs):
+        return None
     # Retrieve matching object by index.
-    target_obj = scene.objects[context.scene.active_gp_index]
+    target_obj = objs[idx]
 
     global gp_select_only_active_on_change
     # Make sure target object is the only selected object.
@@ -278,12 +359,12 @@ def active_gp_index_update_callback(scene: bpy.types.Scene, context: bpy.types.C
 
 
 def refresh_quick_edit_gizmo(context: bpy.types.Context):
+    # The quick edit tool only exists in paint mode: checking the mode first
+    # avoids walking the workspace tool table in every other mode.
+    if context.mode != "PAINT_GPENCIL":
+        return
     tool = context.workspace.tools.from_space_view3d_mode(context.mode)
-    if (
-        tool is not None
-        and tool.mode == "PAINT_GPENCIL"
-        and tool.widget == "VIEW3D_GGT_gpencil_xform_box"
-    ):
+    if tool is not None and tool.widget == "VIEW3D_GGT_gpencil_xform_box":
         bpy.ops.wm.tool_set_by_id(name="builtin.select_lasso")
 
 
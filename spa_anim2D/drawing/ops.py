@@ -1,13 +1,12 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
+import math
 from bisect import bisect
 
 import bpy
-import bpy_extras.view3d_utils
 import bgl
 import gpu
-import gpu_extras.presets
 import mathutils
 
 from spa_anim2D.drawing.core import (
@@ -25,25 +24,59 @@ from spa_anim2D.utils import register_classes, unregister_classes
 
 # Custom Blender build compatibility helper functions
 
+# Capability flags resolved once at import time: whether this Blender build
+# exposes the custom roll/mirror properties on RegionView3D. The helpers below
+# run in draw handlers and polls, where a per-call getattr-with-default adds up.
+VIEW3D_HAS_ROLL = "view_roll_angle" in bpy.types.RegionView3D.bl_rna.properties
+VIEW3D_HAS_MIRROR = "view_mirror_x" in bpy.types.RegionView3D.bl_rna.properties
+
+# RegionView3D has no bpy subclasses: an exact type check in poll functions
+# avoids isinstance's attribute lookup and MRO walk on every UI redraw.
+_RV3D = bpy.types.RegionView3D
+
 
 def view3d_supports_roll(region_3d: bpy.types.RegionView3D) -> bool:
     """Whether 3D view supports roll."""
-    return hasattr(region_3d, "view_roll_angle")
+    return VIEW3D_HAS_ROLL
 
 
 def view3d_is_rolled(region_3d: bpy.types.RegionView3D):
     """Whether 3D view has a non-zero roll value."""
-    return getattr(region_3d, "view_roll_angle", 0) != 0
+    return VIEW3D_HAS_ROLL and region_3d.view_roll_angle != 0
 
 
 def view3d_supports_mirroring(region_3d: bpy.types.RegionView3D) -> bool:
     """Whether 3D view supports mirroring."""
-    return hasattr(region_3d, "view_mirror_x")
+    return VIEW3D_HAS_MIRROR
+
+
+# Cached sorted frame numbers per grease pencil layer, keyed by session pointer.
+# Invalidated on depsgraph updates and file loads (see `clear_frame_numbers_cache`).
+_layer_frame_numbers_cache: dict[int, list[int]] = {}
+
+
+def get_layer_frame_numbers(gpl: bpy.types.GPencilLayer) -> list[int]:
+    """Get the sorted frame numbers of `gpl`, using a per-layer cache.
+
+    Avoids re-reading every frame's frame_number through RNA on each call.
+    """
+    key = gpl.as_pointer()
+    frame_numbers = _layer_frame_numbers_cache.get(key)
+    if frame_numbers is None:
+        frame_numbers = [f.frame_number for f in gpl.frames]
+        _layer_frame_numbers_cache[key] = frame_numbers
+    return frame_numbers
+
+
+@bpy.app.handlers.persistent
+def clear_frame_numbers_cache(*args):
+    """Invalidate the layer frame numbers cache."""
+    _layer_frame_numbers_cache.clear()
 
 
 def view3d_is_mirrored(region_3d: bpy.types.RegionView3D) -> bool:
     """Whether view is mirrored."""
-    return getattr(region_3d, "view_mirror_x", False)
+    return VIEW3D_HAS_MIRROR and region_3d.view_mirror_x
 
 
 class OBJECT_OT_grease_pencil_transfer_mode(bpy.types.Macro):
@@ -65,6 +98,9 @@ class OBJECT_OT_grease_pencil_transfer_mode(bpy.types.Macro):
         }
     ]
 
+    # Whether the macro steps have been defined for the current registration.
+    _defined = False
+
 
 class MSGBUS_OT_layer_objects_active(bpy.types.Operator):
     bl_idname = "msgbus.layer_objects_active"
@@ -130,24 +166,25 @@ class OBJECT_OT_drawing_add(bpy.types.Operator):
     )
 
     def draw(self, context: bpy.types.Context):
-        self.layout.use_property_split = True
-        self.layout.prop(self, "name")
-        self.layout.prop(self, "location_mode")
+        layout = self.layout
+        layout.use_property_split = True
+        layout.prop(self, "name")
+        layout.prop(self, "location_mode")
         if self.location_mode == "VIEW":
-            row = self.layout.row(align=True)
+            region_3d = context.area.spaces.active.region_3d
+            row = layout.row(align=True)
             row.prop(self, "view_offset")
             sub_row = row.row()
-            sub_row.enabled = (
-                context.area.spaces.active.region_3d.view_perspective == "CAMERA"
-            )
+            sub_row.enabled = region_3d.view_perspective == "CAMERA"
             sub_row.prop(self, "pin_to_camera", icon="CON_CAMERASOLVER", text="")
-        row = self.layout.row(align=True, heading="Orient Axis")
+        row = layout.row(align=True, heading="Orient Axis")
         row.prop(self, "view_orient_x", text="X", toggle=True)
         row.prop(self, "view_orient_y", text="Y", toggle=True)
         row.prop(self, "view_orient_z", text="Z", toggle=True)
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
-        if not context.area.spaces.active.region_3d.view_perspective == "CAMERA":
+        region_3d = context.area.spaces.active.region_3d
+        if not region_3d.view_perspective == "CAMERA":
             # Disable camera pinning if outside camera view
             self.pin_to_camera = False
         return context.window_manager.invoke_props_dialog(self)
@@ -159,8 +196,12 @@ class OBJECT_OT_drawing_add(bpy.types.Operator):
         if self.location_mode == "CURSOR":
             obj.location = context.scene.cursor.location.copy()
         else:
-            cam_matrix = view_matrix.inverted()
-            obj.location = cam_matrix @ mathutils.Vector((0, 0, -self.view_offset))
+            # The view matrix is a rigid transform, so its inverse rotation is
+            # the transpose: place the object on the view axis without a full
+            # 4x4 matrix inversion.
+            rot_t = view_matrix.to_3x3().transposed()
+            cam_pos = -(rot_t @ view_matrix.translation)
+            obj.location = cam_pos - rot_t.col[2] * self.view_offset
             if self.pin_to_camera:
                 set_parent(obj, context.scene.camera, use_contraint=True)
         orient_axis = (self.view_orient_x, self.view_orient_y, self.view_orient_z)
@@ -221,15 +262,41 @@ def quick_edit_poll(context: bpy.types.Context) -> bool:
     """Generic poll function for quick-edit related operators."""
     if not getattr(context.active_object, "type", None) == "GPENCIL":
         return False
-    if not isinstance(context.region.data, bpy.types.RegionView3D):
+    if type(context.region.data) is not _RV3D:
         return False
     # Only enable this operator when using the quick edit tool in paint mode.
     tool = context.workspace.tools.from_space_view3d_mode(context.mode)
-    return (
-        tool is not None
-        and tool.mode == "PAINT_GPENCIL"
-        and tool.widget == "VIEW3D_GGT_gpencil_xform_box"
-    )
+    if tool is None or tool.mode != "PAINT_GPENCIL":
+        return False
+    return tool.widget == "VIEW3D_GGT_gpencil_xform_box"
+
+
+# Cached inverted perspective matrix per RegionView3D, keyed by session pointer.
+# Each entry stores the perspective matrix values it was computed from, so a
+# view change naturally invalidates the cached inverse.
+_inverted_perspective_cache: dict[int, tuple[tuple, mathutils.Matrix]] = {}
+
+
+def get_inverted_perspective_matrix(rv3d: bpy.types.RegionView3D) -> mathutils.Matrix:
+    """Get the inverted perspective matrix of `rv3d`, cached per region.
+
+    Skips the 4x4 inversion when the view has not changed since the last call.
+    """
+    persp = rv3d.perspective_matrix
+    persp_values = tuple(persp[0]) + tuple(persp[1]) + tuple(persp[2]) + tuple(persp[3])
+    cached = _inverted_perspective_cache.get(rv3d.as_pointer())
+    if cached is not None and cached[0] == persp_values:
+        return cached[1]
+
+    inverted = persp.inverted()
+    _inverted_perspective_cache[rv3d.as_pointer()] = (persp_values, inverted)
+    return inverted
+
+
+# Constant basis vectors used by `calculate_move_vector`, allocated once and
+# frozen to guard against accidental mutation.
+_GP_PLANE_NORMAL = mathutils.Vector((0.0, 1.0, 0.0)).freeze()
+_VIEW_FORWARD = mathutils.Vector((0.0, 0.0, -1.0)).freeze()
 
 
 def calculate_move_vector(
@@ -239,39 +306,74 @@ def calculate_move_vector(
     This function calculates a vector pointing along `axis` scaled to the current
     pixel size in the viewport (at the distance to the object origin).
     """
-    rv3d: bpy.types.RegionView3D = region.data
-    obj_loc = obj.matrix_world.to_translation().to_3d()
+    # Nothing to compute for a zero axis: skip the unprojections entirely.
+    if axis[0] == 0 and axis[1] == 0:
+        return mathutils.Vector((0.0, 0.0, 0.0))
 
-    # Compute pixel size at object's origin.
-    p_start = bpy_extras.view3d_utils.region_2d_to_location_3d(
-        region, rv3d, (0, 0), obj_loc
-    )
-    p_end = bpy_extras.view3d_utils.region_2d_to_location_3d(
-        region, rv3d, axis, obj_loc
-    )
-    p_vec = p_end - p_start
-    pixel_size = p_vec.length * step
+    rv3d: bpy.types.RegionView3D = region.data
+    matrix_world = obj.matrix_world
+    obj_loc = matrix_world.to_translation().to_3d()
+
+    # Compute pixel size at object's origin, straight from the projection
+    # matrix instead of unprojecting two screen points: window_matrix[1][1]
+    # maps view-space Y to NDC and one pixel spans 2/region.height in NDC.
+    # Perspective scales with the view-space depth of the object.
+    window_scale_y = rv3d.window_matrix[1][1]
+    if rv3d.is_perspective:
+        depth = -(rv3d.view_matrix @ obj_loc).z
+        pixel_world = (2.0 * depth) / (region.height * window_scale_y)
+    else:
+        pixel_world = 2.0 / (region.height * window_scale_y)
+    pixel_size = pixel_world * math.hypot(axis[0], axis[1]) * step
 
     # TODO: Make this dependent on current drawing plane.
     # Front plane of the grease pencil object.
-    obact_normal = obj.matrix_world @ mathutils.Vector((0, 1, 0))
+    obact_normal = matrix_world @ _GP_PLANE_NORMAL
     # Forward vector of active view.
-    forward = rv3d.perspective_matrix.inverted() @ mathutils.Vector((0, 0, -1))
+    forward = get_inverted_perspective_matrix(rv3d) @ _VIEW_FORWARD
 
-    cam_and_obj_aligned = forward.dot(obact_normal) > 0
+    cam_and_obj_aligned = int(forward.dot(obact_normal) > 0)
     # Invert X axis (flip left/right) if only one of those conditions is met:
     # - view is mirrored
     # - view's forward vector and plane's normal are in the same direction
-    flip_x_axis = view3d_is_mirrored(rv3d) != cam_and_obj_aligned
-    if flip_x_axis:
-        axis[0] *= -1
+    # Branchless sign computation; `axis` itself is never mutated, so a caller
+    # passing the operator's IntVectorProperty doesn't compound flips across calls.
+    sign_x = 1 - 2 * (int(view3d_is_mirrored(rv3d)) ^ cam_and_obj_aligned)
 
     # TODO: Make this dependent on current drawing plane.
-    move_vec = mathutils.Vector((axis[0], 0, axis[1]))
+    move_vec = mathutils.Vector((axis[0] * sign_x, 0, axis[1]))
 
     return move_vec * pixel_size
 
 
+# Arrow keys and the axis each one moves along, shared by the gizmo move
+# operators. Each key is bound twice in `_ARROW_KEY_KEYMAPS`: plain, and with
+# shift applying `_ARROW_KEY_SHIFT_STEP`.
+# NOTE: built at module level because class-body comprehensions cannot see
+# other class attributes.
+_ARROW_KEY_SHIFT_STEP = 5
+
+_ARROW_KEY_AXES = (
+    ("UP_ARROW", (0, 1)),
+    ("RIGHT_ARROW", (1, 0)),
+    ("DOWN_ARROW", (0, -1)),
+    ("LEFT_ARROW", (-1, 0)),
+)
+
+_ARROW_KEY_KEYMAPS = [
+    {"key": key, "ctrl": True, "properties": {"axis": axis}}
+    for key, axis in _ARROW_KEY_AXES
+] + [
+    {
+        "key": key,
+        "ctrl": True,
+        "shift": True,
+        "properties": {"axis": axis, "step": _ARROW_KEY_SHIFT_STEP},
+    }
+    for key, axis in _ARROW_KEY_AXES
+]
+
+
 class GPENCIL_OT_base_gizmo_move_with_arrow_keys:
     bl_options = {"UNDO"}
 
@@ -280,38 +382,11 @@ class GPENCIL_OT_base_gizmo_move_with_arrow_keys:
         "category_name": "3D View Generic",
     }
 
-    shift_step = 5
+    shift_step = _ARROW_KEY_SHIFT_STEP
 
-    bl_keymaps = [
-        {"key": "UP_ARROW", "ctrl": True, "properties": {"axis": (0, 1)}},
-        {
-            "key": "UP_ARROW",
-            "ctrl": True,
-            "shift": True,
-            "properties": {"axis": (0, 1), "step": shift_step},
-        },
-        {"key": "RIGHT_ARROW", "ctrl": True, "properties": {"axis": (1, 0)}},
-        {
-            "key": "RIGHT_ARROW",
-            "ctrl": True,
-            "shift": True,
-            "properties": {"axis": (1, 0), "step": shift_step},
-        },
-        {"key": "DOWN_ARROW", "ctrl": True, "properties": {"axis": (0, -1)}},
-        {
-            "key": "DOWN_ARROW",
-            "ctrl": True,
-            "shift": True,
-            "properties": {"axis": (0, -1), "step": shift_step},
-        },
-        {"key": "LEFT_ARROW", "ctrl": True, "properties": {"axis": (-1, 0)}},
-        {
-            "key": "LEFT_ARROW",
-            "ctrl": True,
-            "shift": True,
-            "properties": {"axis": (-1, 0), "step": shift_step},
-        },
-    ]
+    arrow_key_axes = _ARROW_KEY_AXES
+
+    bl_keymaps = _ARROW_KEY_KEYMAPS
 
     axis: bpy.props.IntVectorProperty(
         name="Axis",
@@ -336,12 +411,87 @@ class GPENCIL_OT_quick_edit_strokes_move(
     bl_label = "Move Grease Pencil Strokes"
     bl_description = "Move selected Grease Pencil strokes in quick edit tool"
 
+    # Arrow-key event types mapped to their movement axis, used to accumulate
+    # key repeats while running modally.
+    arrow_key_events = dict(GPENCIL_OT_base_gizmo_move_with_arrow_keys.arrow_key_axes)
+
     @classmethod
     def poll(cls, context: bpy.types.Context):
         return quick_edit_poll(context)
 
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        if self.axis[0] == 0 and self.axis[1] == 0:
+            return self.execute(context)
+
+        # Run modally and coalesce held-key repeats: accumulate the pixel
+        # offsets of incoming arrow-key events and apply at most one transform
+        # per timer tick, instead of one transform + gizmo refresh per repeat.
+        self.pending_x = self.axis[0] * self.step
+        self.pending_y = self.axis[1] * self.step
+        self.timer = context.window_manager.event_timer_add(
+            1 / 60, window=context.window
+        )
+        context.window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event):
+        if event.type == "TIMER":
+            self.apply_pending_move(context)
+            return {"RUNNING_MODAL"}
+
+        if axis := self.arrow_key_events.get(event.type):
+            # Accumulate key repeats; apply leftovers and stop on release.
+            if event.value == "PRESS":
+                step = self.shift_step if event.shift else 1
+                self.pending_x += axis[0] * step
+                self.pending_y += axis[1] * step
+                return {"RUNNING_MODAL"}
+            if event.value == "RELEASE":
+                return self.finish(context)
+
+        if event.type in {"RIGHTMOUSE", "ESC"}:
+            return self.finish(context)
+
+        return {"PASS_THROUGH"}
+
+    def finish(self, context: bpy.types.Context):
+        self.apply_pending_move(context)
+        context.window_manager.event_timer_remove(self.timer)
+        return {"FINISHED"}
+
+    def apply_pending_move(self, context: bpy.types.Context):
+        pending_x = self.pending_x
+        pending_y = self.pending_y
+        if pending_x == 0 and pending_y == 0:
+            return
+        self.pending_x = self.pending_y = 0
+
+        # Apply the accumulated offset in one transform, passing the unit
+        # direction and the offset length in pixels as the step.
+        length = math.hypot(pending_x, pending_y)
+        move_vec = calculate_move_vector(
+            context.active_object,
+            context.region,
+            (pending_x / length, pending_y / length),
+            length,
+        )
+
+        bpy.ops.transform.transform(
+            mode="TRANSLATION",
+            value=move_vec.to_4d(),
+            orient_type="LOCAL",
+            gpencil_strokes=True,
+        )
+
+        # Refresh the quick edit gizmo, only touching the tool when applicable.
+        # TODO: Find a better solution for this.
+        refresh_quick_edit_gizmo(context)
+
     def execute(self, context: bpy.types.Context):
-        # Calculate the vector to move the strokes in
+        # Single-shot path (e.g: scripted calls without an event loop).
+        if self.axis[0] == 0 and self.axis[1] == 0:
+            return {"CANCELLED"}
+
         move_vec = calculate_move_vector(
             context.active_object, context.region, self.axis, self.step
         )
@@ -358,9 +508,9 @@ class GPENCIL_OT_quick_edit_strokes_move(
         if res != {"FINISHED"}:
             return {"CANCELLED"}
 
-        # Re-set the tool to update quick edit gizmo.
+        # Refresh the quick edit gizmo, only touching the tool when applicable.
         # TODO: Find a better solution for this.
-        bpy.ops.wm.tool_set_by_id(name="builtin.select_lasso")
+        refresh_quick_edit_gizmo(context)
 
         return {"FINISHED"}
 
@@ -412,7 +562,7 @@ class GPENCIL_OT_quick_edit_strokes_duplicate(bpy.types.Operator):
         # Confirm translation.
         if event.type in {"LEFTMOUSE", "ENTER"} and event.value in {"RELEASE"}:
             # Force quick edit gizmo display update.
-            bpy.ops.wm.tool_set_by_id(name="builtin.select_lasso")
+            refresh_quick_edit_gizmo(context)
             return {"FINISHED"}
         # Cancel translation (strokes are still duplicated).
         elif event.type in {"RIGHTMOUSE", "ESC"} and event.value in {"RELEASE"}:
@@ -425,15 +575,13 @@ def shift_and_trace_poll(context: bpy.types.Context) -> bool:
     """Generic poll function for shift-and-trace related operators."""
     if not getattr(context.active_object, "type", None) == "GPENCIL":
         return False
-    if not isinstance(context.region.data, bpy.types.RegionView3D):
+    if type(context.region.data) is not _RV3D:
         return False
     # Only enable this operator when using the shift and trace tool in paint mode.
     tool = context.workspace.tools.from_space_view3d_mode(context.mode)
-    return (
-        tool is not None
-        and tool.mode == "PAINT_GPENCIL"
-        and tool.widget == "VIEW3D_GGT_gpencil_frame_offset"
-    )
+    if tool is None or tool.mode != "PAINT_GPENCIL":
+        return False
+    return tool.widget == "VIEW3D_GGT_gpencil_frame_offset"
 
 
 class GPENCIL_OT_shift_and_trace_frame_move(
@@ -448,6 +596,10 @@ class GPENCIL_OT_shift_and_trace_frame_move(
         return shift_and_trace_poll(context)
 
     def execute(self, context: bpy.types.Context):
+        # A zero axis would be a no-op move: cancel early.
+        if self.axis[0] == 0 and self.axis[1] == 0:
+            return {"CANCELLED"}
+
         gpd: bpy.types.GreasePencil = context.active_object.data
         frame_offset_settings = context.tool_settings.gpencil_frame_offset
         use_current_frame = frame_offset_settings.use_current_frame
@@ -464,15 +616,8 @@ class GPENCIL_OT_shift_and_trace_frame_move(
             if use_current_frame:
                 frame = gpd.layers.active.active_frame
             else:
-                idx = max(
-                    bisect(
-                        gpd.layers.active.frames,
-                        frame_offset_settings.frame,
-                        key=lambda x: x.frame_number,
-                    )
-                    - 1,
-                    0,
-                )
+                frame_numbers = get_layer_frame_numbers(gpd.layers.active)
+                idx = max(bisect(frame_numbers, frame_offset_settings.frame) - 1, 0)
                 frame = gpd.layers.active.frames[idx]
         else:
             pass
@@ -486,7 +631,12 @@ class GPENCIL_OT_shift_and_trace_frame_move(
         )
 
         # FIXME: Changing the translation of the frame should update the matrix so we don't have to do this here
-        frame.offset = frame.offset @ mathutils.Matrix.Translation(move_vec.to_4d())
+        # Equivalent to `frame.offset @ Matrix.Translation(move_vec)`: a pure
+        # translation on the right only adds the rotated vector to the offset's
+        # translation column, no full 4x4 multiply needed.
+        offset = frame.offset.copy()
+        offset.translation += offset.to_3x3() @ move_vec
+        frame.offset = offset
 
         # Project move_vec onto transform plane and shift transform value
         # FIXME: This needs to not be hardcoded
@@ -517,17 +667,17 @@ class VIEW3D_OT_view_roll_2d(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
-        return isinstance(
-            context.region_data, bpy.types.RegionView3D
-        ) and view3d_supports_roll(context.region_data)
+        return type(context.region_data) is _RV3D and view3d_supports_roll(
+            context.region_data
+        )
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
-        self.center = (
-            mathutils.Vector((context.region.width, context.region.height)) / 2
-        )
-        self.mouse_start = (
-            mathutils.Vector((event.mouse_region_x, event.mouse_region_y)) - self.center
-        )
+        # Keep mouse state as plain floats: the modal handler runs at mouse
+        # polling rate and shouldn't allocate vectors per event.
+        self.center_x = context.region.width / 2
+        self.center_y = context.region.height / 2
+        self.mouse_start_x = event.mouse_region_x - self.center_x
+        self.mouse_start_y = event.mouse_region_y - self.center_y
         self.rotation_start = context.space_data.region_3d.view_roll_angle
 
         self.view_cam_offset = mathutils.Vector(
@@ -554,30 +704,40 @@ class VIEW3D_OT_view_roll_2d(bpy.types.Operator):
         region_3d = context.space_data.region_3d
         region_3d.view_roll_angle = self.rotation_start + delta_angle
 
-        rot_mat2d = mathutils.Matrix.Rotation(delta_angle, 2)
-
-        cam_offset = self.view_cam_offset.copy()
+        # Inline 2D rotation on scalars: same math as rotating a copy of the
+        # camera offset by Matrix.Rotation(delta_angle, 2), without allocating
+        # a matrix and a vector per mouse-move event.
+        cos_a = math.cos(delta_angle)
+        sin_a = math.sin(delta_angle)
 
         view3d_mirrored = view3d_is_mirrored(region_3d)
 
-        cam_offset.y *= self.ratio
+        offset_x = self.view_cam_offset.x
+        offset_y = self.view_cam_offset.y * self.ratio
         if view3d_mirrored:
-            cam_offset.x *= -1
-        cam_offset.rotate(rot_mat2d)
+            offset_x = -offset_x
+        new_x = cos_a * offset_x - sin_a * offset_y
+        new_y = sin_a * offset_x + cos_a * offset_y
         if view3d_mirrored:
-            cam_offset.x *= -1
-        cam_offset.y /= self.ratio
+            new_x = -new_x
 
-        region_3d.view_camera_offset = cam_offset
+        region_3d.view_camera_offset = (new_x, new_y / self.ratio)
 
     def modal(self, context: bpy.types.Context, event: bpy.types.Event):
         status = "RUNNING_MODAL"
         if event.type in {"MOUSEMOVE"}:
-            mouse_current = (
-                mathutils.Vector((event.mouse_region_x, event.mouse_region_y))
-                - self.center
+            # Bind instance state to locals: each self.<attr> is a dict lookup
+            # and this handler runs at mouse polling rate.
+            mouse_start_x = self.mouse_start_x
+            mouse_start_y = self.mouse_start_y
+            mouse_x = event.mouse_region_x - self.center_x
+            mouse_y = event.mouse_region_y - self.center_y
+            # Same result as `mouse_current.angle_signed(self.mouse_start)`,
+            # computed on scalars to avoid two Vector allocations per event.
+            delta_angle = math.atan2(
+                mouse_y * mouse_start_x - mouse_x * mouse_start_y,
+                mouse_x * mouse_start_x + mouse_y * mouse_start_y,
             )
-            delta_angle = mouse_current.angle_signed(self.mouse_start)
             if view3d_is_mirrored(context.region_data):
                 delta_angle *= -1
             self.update_view_roll(context, delta_angle)
@@ -604,20 +764,23 @@ class VIEW3D_OT_view_roll_2d(bpy.types.Operator):
             return
 
         angle = context.space_data.region_3d.view_roll_angle
-        center = (region.width / 2.0, region.height / 2.0)
-        radius = min(region.width * 0.6 / 2.0, region.height * 0.6 / 2.0)
+        width = region.width
+        height = region.height
+        center = (width / 2.0, height / 2.0)
+        radius = min(width * 0.6 / 2.0, height * 0.6 / 2.0)
         ratio = context.scene.render.resolution_y / context.scene.render.resolution_x
         up_tick_length = radius * 0.1
         center_col = (0.2, 0.2, 0.2, 0.8)
         main_col = (0.15, 0.56, 1.0, 0.9)
 
         # Center of rotation.
+        # Circle batches are cached on the drawer across redraws.
         bgl.glLineWidth(1)
-        gpu_extras.presets.draw_circle_2d(center, center_col, 3, segments=16)
+        drawer.draw_circle(center, center_col, 3, segments=16)
 
         # Main circle.
         bgl.glLineWidth(3)
-        gpu_extras.presets.draw_circle_2d(center, main_col, radius, segments=64)
+        drawer.draw_circle(center, main_col, radius, segments=64)
 
         with gpu.matrix.push_pop():
             gpu.matrix.translate(center)
@@ -655,21 +818,24 @@ class VIEW3D_OT_view_roll_2d_reset(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
-        return isinstance(
-            context.region_data, bpy.types.RegionView3D
-        ) and view3d_is_rolled(context.region_data)
+        return type(context.region_data) is _RV3D and view3d_is_rolled(
+            context.region_data
+        )
 
     def execute(self, context):
         region_3d = context.space_data.region_3d
-        rot_mat2d = mathutils.Matrix.Rotation(-region_3d.view_roll_angle, 2)
+        # Inline 2D rotation by the opposite of the roll angle on scalars.
+        cos_a = math.cos(-region_3d.view_roll_angle)
+        sin_a = math.sin(-region_3d.view_roll_angle)
         ratio = context.region.height / context.region.width
 
-        cam_offset = mathutils.Vector(region_3d.view_camera_offset)
-        cam_offset.y *= ratio
-        cam_offset.rotate(rot_mat2d)
-        cam_offset.y /= ratio
+        offset_x, offset_y = region_3d.view_camera_offset
+        offset_y *= ratio
 
-        region_3d.view_camera_offset = cam_offset
+        region_3d.view_camera_offset = (
+            cos_a * offset_x - sin_a * offset_y,
+            (sin_a * offset_x + cos_a * offset_y) / ratio,
+        )
         region_3d.view_roll_angle = 0
 
         return {"FINISHED"}
@@ -707,9 +873,9 @@ class VIEW3D_OT_view_mirror(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
-        return isinstance(
-            context.region_data, bpy.types.RegionView3D
-        ) and view3d_supports_mirroring(context.region_data)
+        return type(context.region_data) is _RV3D and view3d_supports_mirroring(
+            context.region_data
+        )
 
     def execute(self, context):
         region_3d = context.region_data
@@ -736,7 +902,7 @@ class VIEW3D_GGT_view_roll_2d(bpy.types.GizmoGroup):
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
-        return getattr(context.space_data.region_3d, "view_roll_angle", 0) != 0
+        return view3d_is_rolled(context.space_data.region_3d)
 
     def draw_prepare(self, context: bpy.types.Context):
         if not self.gizmos:
@@ -764,35 +930,50 @@ class VIEW3D_GGT_view_roll_2d(bpy.types.GizmoGroup):
         self.gizmo.color_highlight = 0.15, 0.56, 1.0
 
 
+# Constraint axes for `transform.mirror` per screen-space mirror axis.
+# Drawings live in the XZ plane, so a vertical ("Y") mirror flips local Z.
+_MIRROR_CONSTRAINT_AXES = {
+    "X": (True, False, False),
+    "Y": (False, False, True),
+}
+
+
 class GPENCIL_OT_mirror_strokes(bpy.types.Operator):
     bl_idname = "gpencil.mirror_strokes"
     bl_label = "Mirror"
     bl_description = "Mirror the selected strokes"
 
-    axis: bpy.props.StringProperty(name="axis", default="X")
+    axis: bpy.props.EnumProperty(
+        name="axis",
+        items=(
+            ("X", "X", "Mirror horizontally"),
+            ("Y", "Y", "Mirror vertically"),
+        ),
+        default="X",
+    )
 
     @classmethod
     def poll(cls, context: bpy.types.Context):
         if not getattr(context.active_object, "type", None) == "GPENCIL":
             return False
-        if not isinstance(context.region.data, bpy.types.RegionView3D):
+        if type(context.region.data) is not _RV3D:
             return False
         return True
 
     def execute(self, context: bpy.types.Context):
-        previous_pivot = context.tool_settings.transform_pivot_point
-        context.tool_settings.transform_pivot_point = "BOUNDING_BOX_CENTER"
-
-        constraint_axis = (
-            (True, False, False) if self.axis == "X" else (False, False, True)
-        )
+        tool_settings = context.tool_settings
+        previous_pivot = tool_settings.transform_pivot_point
+        # Only write the pivot point (an RNA update) when it actually changes.
+        if previous_pivot != "BOUNDING_BOX_CENTER":
+            tool_settings.transform_pivot_point = "BOUNDING_BOX_CENTER"
 
         bpy.ops.transform.mirror(
             orient_type="LOCAL",
-            constraint_axis=constraint_axis,
+            constraint_axis=_MIRROR_CONSTRAINT_AXES[self.axis],
             gpencil_strokes=True,
         )
-        context.tool_settings.transform_pivot_point = previous_pivot
+        if previous_pivot != "BOUNDING_BOX_CENTER":
+            tool_settings.transform_pivot_point = previous_pivot
 
         refresh_quick_edit_gizmo(context)
 
@@ -819,9 +1000,21 @@ classes = (
 def register():
     register_classes(classes)
 
-    OBJECT_OT_grease_pencil_transfer_mode.define("OBJECT_OT_transfer_mode")
-    OBJECT_OT_grease_pencil_transfer_mode.define("MSGBUS_OT_layer_objects_active")
+    # Guard against defining the macro steps twice if register runs again
+    # without a matching unregister (e.g. on script reload).
+    if not OBJECT_OT_grease_pencil_transfer_mode._defined:
+        OBJECT_OT_grease_pencil_transfer_mode.define("OBJECT_OT_transfer_mode")
+        OBJECT_OT_grease_pencil_transfer_mode.define("MSGBUS_OT_layer_objects_active")
+        OBJECT_OT_grease_pencil_transfer_mode._defined = True
+
+    bpy.app.handlers.depsgraph_update_post.append(clear_frame_numbers_cache)
+    bpy.app.handlers.load_pre.append(clear_frame_numbers_cache)
 
 
 def unregister():
     unregister_classes(classes)
+
+    OBJECT_OT_grease_pencil_transfer_mode._defined = False
+
+    bpy.app.handlers.depsgraph_update_post.remove(clear_frame_numbers_cache)
+    bpy.app.handlers.load_pre.remove(clear_frame_numbers_cache)
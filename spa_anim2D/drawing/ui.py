@@ -2,7 +2,7 @@
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
 import bpy
-from spa_anim2D.animation.pegs.core import get_bones_from_peg_bone_group
+from spa_anim2D.animation.pegs.core import PEGS_OFFSET_BONE_PREFIX
 
 from spa_anim2D.drawing.core import get_active_gp_object, is_parented_to
 from spa_anim2D.drawing.ops import (
@@ -22,13 +22,17 @@ class SCENE_UL_gpencil_objects(bpy.types.UIList):
 
     bl_idname = "SCENE_UL_gpencil"
 
+    # Session pointers of objects parented to the scene camera, rebuilt in
+    # `filter_items` at the start of each redraw (see there).
+    _pinned_objects: frozenset[int] = frozenset()
+
     def draw_item(
         self, context, layout, data, item, icon, active_data, active_propname
     ):
         layout.prop(item, "name", text="", emboss=False)
         camera_pin_icon = (
             "CON_CAMERASOLVER"
-            if is_parented_to(item, context.scene.camera)
+            if item.as_pointer() in self._pinned_objects
             else "BLANK1"
         )
         layout.label(icon=camera_pin_icon, text="")
@@ -38,21 +42,35 @@ class SCENE_UL_gpencil_objects(bpy.types.UIList):
 
         layout.prop(item, "show_in_front", text="", icon="AXIS_FRONT")
 
-    def filter_item_flag(self, obj):
-        """Filter function defining whether an item should be displayed in the list."""
-        if (
-            isinstance(obj.data, bpy.types.GreasePencil)
-            and self.filter_name.strip().lower() in obj.name.lower()
-        ):
-            return self.bitflag_filter_item
-        return 0
-
     def filter_items(self, context: bpy.types.Context, obj, propname):
         objects = getattr(obj, propname)
 
         flt_neworder = []
 
-        flt_flags = [self.filter_item_flag(obj) for obj in objects]
+        # Delegate the name-substring match to Blender's native helper, which
+        # loops over the collection in C; only the GreasePencil type test
+        # stays in Python. This runs on every redraw over all scene objects.
+        bit = self.bitflag_filter_item
+        if self.filter_name:
+            flt_flags = bpy.types.UI_UL_list.filter_items_by_name(
+                self.filter_name, bit, objects, "name"
+            )
+        else:
+            flt_flags = [bit] * len(objects)
+
+        gpencil_type = bpy.types.GreasePencil
+        for i, o in enumerate(objects):
+            if not isinstance(o.data, gpencil_type):
+                flt_flags[i] = 0
+
+        # Resolve camera parenting once per redraw instead of walking each
+        # item's constraints again in every `draw_item` call.
+        camera = context.scene.camera
+        self.__class__._pinned_objects = frozenset(
+            o.as_pointer()
+            for i, o in enumerate(objects)
+            if flt_flags[i] and is_parented_to(o, camera)
+        )
 
         return flt_flags, flt_neworder
 
@@ -85,16 +103,30 @@ class GPENCIL_MT_layer_peg_link_select(bpy.types.Menu):
 
         armature_object: bpy.types.Object = gpd.pegbar_object
 
-        # First entry is there to unlink the peg.
-        self.layout.operator("anim.peg_parent_active_layer", text=" - ").unparent = True
+        layout = self.layout
 
-        # Iterate through all the bones and create entries for them. Highlight the currently linked peg (if there is one).
+        # First entry is there to unlink the peg.
+        layout.operator("anim.peg_parent_active_layer", text=" - ").unparent = True
+
+        # Map each bone group to its offset bone in a single pass over the
+        # bones, instead of rescanning all bones for every group.
+        offset_bone_names = {}
+        for pose_bone in armature_object.pose.bones:
+            if pose_bone.bone_group and pose_bone.name.startswith(
+                PEGS_OFFSET_BONE_PREFIX
+            ):
+                offset_bone_names[pose_bone.bone_group.name] = pose_bone.name
+
+        # Create entries for all the pegs. Highlight the currently linked peg
+        # (if there is one).
+        active_parent_bone = gpd.layers.active.parent_bone
         for bone_group in armature_object.pose.bone_groups:
-            _, offset = get_bones_from_peg_bone_group(armature_object, bone_group)
             icon = (
-                "STATUSBAR" if offset.name == gpd.layers.active.parent_bone else "NONE"
+                "STATUSBAR"
+                if offset_bone_names.get(bone_group.name) == active_parent_bone
+                else "NONE"
             )
-            self.layout.operator(
+            layout.operator(
                 "anim.peg_parent_active_layer", text=bone_group.name, icon=icon
             ).peg_name = bone_group.name
 
@@ -106,22 +138,48 @@ class GPENCIL_UL_draw_layer(bpy.types.UIList):
 
     bl_idname = "GPENCIL_UL_draw_layer"
 
+    # Peg bone name to bone group name mapping, rebuilt in `filter_items` at
+    # the start of each redraw (see there).
+    _bone_groups: dict[str, str] = {}
+
+    def filter_items(self, context: bpy.types.Context, data, propname):
+        # Resolve the pegbar bone groups once per redraw instead of doing two
+        # RNA lookups per layer row in `draw_item`.
+        armature_object: bpy.types.Object = data.pegbar_object
+        if armature_object:
+            self.__class__._bone_groups = {
+                pb.name: pb.bone_group.name
+                for pb in armature_object.pose.bones
+                if pb.bone_group
+            }
+        else:
+            self.__class__._bone_groups = {}
+
+        # Keep the list's built-in filtering and sorting working on the layer
+        # name, as they would without a filter_items override; empty results
+        # mean "show all layers in their original order".
+        layers = getattr(data, propname)
+        flt_flags = []
+        flt_neworder = []
+        if self.filter_name:
+            flt_flags = bpy.types.UI_UL_list.filter_items_by_name(
+                self.filter_name, self.bitflag_filter_item, layers, "info"
+            )
+        if self.use_filter_sort_alpha:
+            flt_neworder = bpy.types.UI_UL_list.sort_items_by_name(layers, "info")
+
+        return flt_flags, flt_neworder
+
     def draw_item(
         self, context, layout, data, item, icon, active_data, active_propname
     ):
-        armature_object: bpy.types.Object = data.pegbar_object
-        pose_bone = (
-            armature_object.pose.bones.get(item.parent_bone)
-            if armature_object
-            else None
-        )
-
         # Layer name
         layout.prop(item, "info", text="", emboss=False)
 
         # Peg name
-        icon = "NONE" if item.parent_bone == "" else "STATUSBAR"
-        layout.label(text=pose_bone.bone_group.name if pose_bone else "", icon=icon)
+        parent_bone = item.parent_bone
+        icon = "NONE" if parent_bone == "" else "STATUSBAR"
+        layout.label(text=self._bone_groups.get(parent_bone, ""), icon=icon)
 
         # Layer properties
         sub = layout.row(align=True)
@@ -165,7 +223,9 @@ class VIEW3D_PT_draw_panel(bpy.types.Panel):
             )
 
     def draw(self, context: bpy.types.Context):
-        row = self.layout.row()
+        layout = self.layout
+        scene = context.scene
+        row = layout.row()
 
         active_gp = get_active_gp_object()
         sub_row = row.row()
@@ -194,13 +254,13 @@ class VIEW3D_PT_draw_panel(bpy.types.Panel):
         )
 
         # List of grease pencil objects in the scene
-        row = self.layout.row()
+        row = layout.row()
         row.template_list(
             SCENE_UL_gpencil_objects.bl_idname,
             "",
-            context.scene,
+            scene,
             "objects",
-            context.scene,
+            scene,
             "active_gp_index",
             type="DEFAULT",
             columns=2,
@@ -215,7 +275,7 @@ class VIEW3D_PT_draw_panel(bpy.types.Panel):
             "object.pin_to_camera",
             icon="CON_CAMERASOLVER",
             text="",
-            depress=is_parented_to(context.active_object, context.scene.camera),
+            depress=is_parented_to(context.active_object, scene.camera),
         )
 
         col.operator(
@@ -228,14 +288,15 @@ class VIEW3D_PT_draw_panel(bpy.types.Panel):
             return
 
         # Active GP object layers list and tools
-        row = self.layout.row()
+        row = layout.row()
 
+        gpd = active_gp.data
         row.template_list(
             GPENCIL_UL_draw_layer.bl_idname,
             "",
-            active_gp.data,
+            gpd,
             "layers",
-            active_gp.data.layers,
+            gpd.layers,
             "active_index",
             type="DEFAULT",
             columns=2,
@@ -251,19 +312,26 @@ class VIEW3D_PT_draw_panel(bpy.types.Panel):
         col.operator("gpencil.layer_move", icon="TRIA_UP", text="").type = "UP"
         col.operator("gpencil.layer_move", icon="TRIA_DOWN", text="").type = "DOWN"
 
-        if gpl := active_gp.data.layers.active:
-            self.draw_gpencil_layer_peg_ui(self.layout, gpl)
+        if gpl := gpd.layers.active:
+            self.draw_gpencil_layer_peg_ui(layout, active_gp, gpl)
 
     def draw_gpencil_layer_peg_ui(
-        self, layout: bpy.types.UILayout, gpl: bpy.types.GPencilLayer
+        self,
+        layout: bpy.types.UILayout,
+        active_gp: bpy.types.Object,
+        gpl: bpy.types.GPencilLayer,
     ):
-        """Draw grease pencil layer peg selection UI."""
+        """Draw grease pencil layer peg selection UI.
+
+        :param layout: The layout to draw into.
+        :param active_gp: The active grease pencil object.
+        :param gpl: The active layer of `active_gp`.
+        """
         row = layout.row(heading="Peg")
 
-        active_gp = get_active_gp_object()
         armature_object: bpy.types.Object = active_gp.data.pegbar_object
         pose_bone = (
-            armature_object.pose.bones.get(active_gp.data.layers.active.parent_bone)
+            armature_object.pose.bones.get(gpl.parent_bone)
             if armature_object
             else None
         )
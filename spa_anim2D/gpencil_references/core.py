@@ -1,11 +1,18 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
+import math
+
 import bpy
 import bpy_extras
 from mathutils import Vector
 
 
+# Fill UVs of the four corners of a reference rectangle, flattened for
+# `foreach_set` (see `create_gpencil_reference`).
+_REFERENCE_UV_FILL = (0.5, 0.5, -0.5, 0.5, -0.5, -0.5, 0.5, -0.5)
+
+
 # Maps the values for `bpy.types.GPencilSculptSettings.lock_axis` to `bpy.ops.gpencil.reproject.type`
 reprojection_type_map = {
     "VIEW": "VIEW",
@@ -26,6 +33,18 @@ def calculate_view_center_location(obj: bpy.types.Object, region: bpy.types.Regi
 
 
 def calculate_camera_border_height_pixels(scene, camera_obj, region, rv3d):
+    # Fast path: when the region has the same aspect ratio as the render, the
+    # camera border spans the region scaled by the camera zoom factor
+    # (Blender's BKE_screen_view3d_zoom_to_fac formula), with no need to
+    # build and project the camera view frame.
+    rd = scene.render
+    render_aspect = (rd.resolution_x * rd.pixel_aspect_x) / (
+        rd.resolution_y * rd.pixel_aspect_y
+    )
+    if abs(render_aspect - region.width / region.height) < 1e-6:
+        zoom_fac = (math.sqrt(2) + rv3d.view_camera_zoom / 50) ** 2 / 4
+        return region.height * zoom_fac
+
     points = camera_obj.data.view_frame(scene=scene)[:2]
     points = [camera_obj.matrix_world @ v for v in points]
     points_px = [
@@ -94,24 +113,55 @@ def create_gpencil_reference(
     gps_new.material_index = idx
 
     # TODO: Align the stroke with the drawing plane
-    coords = [
-        location + Vector(c)
-        for c in (
-            (width / 2, 0, height / 2),
-            (-width / 2, 0, height / 2),
-            (-width / 2, 0, -height / 2),
-            (width / 2, 0, -height / 2),
-        )
-    ]
-    uvs = [(0.5, 0.5), (-0.5, 0.5), (-0.5, -0.5), (0.5, -0.5)]
+    # Set all point coordinates and UVs in two bulk RNA calls instead of
+    # one assignment per point attribute.
+    loc_x, loc_y, loc_z = location
+    half_w = width / 2
+    half_h = height / 2
+    corners = (
+        (loc_x + half_w, loc_y, loc_z + half_h),
+        (loc_x - half_w, loc_y, loc_z + half_h),
+        (loc_x - half_w, loc_y, loc_z - half_h),
+        (loc_x + half_w, loc_y, loc_z - half_h),
+    )
+    points = gps_new.points
+    points.foreach_set("co", [v for corner in corners for v in corner])
+    points.foreach_set("uv_fill", _REFERENCE_UV_FILL)
 
-    for i, (co, uv) in enumerate(zip(coords, uvs)):
-        gps_new.points[i].co = co
-        gps_new.points[i].uv_fill = uv
+    # Select the new stroke directly: callers deselect beforehand and rely on
+    # the selection for reprojection, without a select_all operator round-trip.
+    gps_new.select = True
+    points.foreach_set("select", (True,) * 4)
 
     return gps_new
 
 
+def calculate_reference_view_params(
+    context: bpy.types.Context, obj: bpy.types.Object
+) -> tuple[Vector, float]:
+    """
+    Compute the view parameters used to place imported references.
+
+    These only depend on the view and the object, so they can be computed once
+    and shared when importing several references in a row.
+
+    :param context: The active context.
+    :param obj: The grease pencil object.
+    :return: The view center location and the reference height in pixels.
+    """
+    scene = context.scene
+    region = context.region
+    rv3d = region.data
+    center = calculate_view_center_location(obj, region)
+
+    if rv3d.view_perspective == "CAMERA":
+        h = calculate_camera_border_height_pixels(scene, scene.camera, region, rv3d)
+    else:
+        h = region.height - 100  # margin of 50 pxS
+
+    return center, h
+
+
 def import_image_as_gp_reference(
     context: bpy.types.Context,
     obj: bpy.types.Object,
@@ -119,7 +169,10 @@ def import_image_as_gp_reference(
     pack_image: bool,
     add_new_layer: bool,
     add_new_keyframe: bool,
-):
+    view_params: tuple[Vector, float] = None,
+    reproject: bool = True,
+    pack_data: bytes = None,
+) -> bpy.types.GPencilStroke:
     """
     Import image from `img_filepath` as a textured rectangle in the given
     grease pencil object.
@@ -129,16 +182,30 @@ def import_image_as_gp_reference(
     :param filepath: The image filepath
     :param pack_image: Whether to pack the image into the Blender file.
     :param add_new_layer: Whether to add a new layer.
+    :param add_new_keyframe: Whether to add a new keyframe.
+    :param view_params: Precomputed view parameters
+                        (see `calculate_reference_view_params`).
+    :param reproject: Whether to reproject the new stroke to the drawing plane.
+                      Callers importing several references can batch a single
+                      reprojection instead.
+    :param pack_data: Encoded image bytes to pack from, if already in memory.
+    :return: The created grease pencil stroke.
     """
-    scene = context.scene
-    rv3d = context.region.data
     gpd: bpy.types.GreasePencil = obj.data
     ts = context.tool_settings
-    center = calculate_view_center_location(obj, context.region)
+
+    if view_params is None:
+        view_params = calculate_reference_view_params(context, obj)
+    center, h = view_params
 
     image = bpy.data.images.load(img_filepath)
     if pack_image:
-        image.pack()
+        if pack_data is not None:
+            # Pack from the in-memory encoded bytes instead of having
+            # Blender re-read the file from disk.
+            image.pack(data=pack_data, data_len=len(pack_data))
+        else:
+            image.pack()
 
     if not gpd.layers.active:
         gpl = gpd.layers.new(image.name)
@@ -158,13 +225,6 @@ def import_image_as_gp_reference(
         else:
             gpf = gpl.active_frame
 
-    if rv3d.view_perspective == "CAMERA":
-        h = calculate_camera_border_height_pixels(
-            scene, scene.camera, context.region, rv3d
-        )
-    else:
-        h = context.region.height - 100  # margin of 50 pxS
-
     aspect = image.size[0] / image.size[1]
     image_width = calculate_image_width_world_space(
         context.region,
@@ -183,9 +243,12 @@ def import_image_as_gp_reference(
         center,
     )
 
-    # Selection
-    bpy.ops.gpencil.select_all(action="DESELECT")
-    gps.select = True
+    if reproject:
+        # Reproject the reference flat to the drawing plane. The stroke is
+        # created selected; the caller is responsible for deselecting any
+        # previous selection beforehand.
+        bpy.ops.gpencil.reproject(
+            type=reprojection_type_map[ts.gpencil_sculpt.lock_axis]
+        )
 
-    # Reproject the reference flat to the drawing plane
-    bpy.ops.gpencil.reproject(type=reprojection_type_map[ts.gpencil_sculpt.lock_axis])
+    return gps
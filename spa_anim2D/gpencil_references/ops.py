@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import io
 import os
 from pathlib import Path
 import tempfile
+import threading
 
 import bpy
 
@@ -16,10 +19,39 @@ except ModuleNotFoundError:
     PILLOW_AVAILABLE = False
 
 from bpy_extras.io_utils import ImportHelper
-from spa_anim2D.gpencil_references.core import import_image_as_gp_reference
+from spa_anim2D.gpencil_references.core import (
+    calculate_reference_view_params,
+    import_image_as_gp_reference,
+    reprojection_type_map,
+)
 from spa_anim2D.utils import register_classes, unregister_classes
 
 
+def prefetch_image_files(filepaths: list[str]):
+    """Warm the OS page cache for the given files on background threads.
+
+    `bpy.data.images.load` reads each file serially on the main thread;
+    prefetching the bytes in parallel lets those reads mostly hit the page
+    cache instead of the disk.
+
+    :param filepaths: The image filepaths about to be loaded.
+    """
+
+    def read_file(path: str):
+        try:
+            with open(path, "rb") as f:
+                while f.read(1 << 20):
+                    pass
+        except OSError:
+            pass
+
+    executor = ThreadPoolExecutor(max_workers=min(4, len(filepaths)))
+    for path in filepaths:
+        executor.submit(read_file, path)
+    # Don't block: the loads overlap with the remaining prefetch reads.
+    executor.shutdown(wait=False)
+
+
 class IMPORT_OT_gpencil_reference_from_clipboard(bpy.types.Operator):
     bl_idname = "import.gpencil_reference_from_clipboard"
     bl_label = "Paste Reference from Clipboard"
@@ -44,54 +76,108 @@ class IMPORT_OT_gpencil_reference_from_clipboard(bpy.types.Operator):
             return False
         return True
 
-    def execute(self, context: bpy.types.Context):
-        obj = context.active_object
-        gpd = obj.data
+    def _grab_clipboard(self):
+        """Grab the clipboard content and save image buffers to disk.
 
-        img_filepaths = []
-        pack_image = True
+        Runs on a worker thread: must not touch Blender data.
+        """
         try:
             img_clip = ImageGrab.grabclipboard()
             # If clipboard contains filepaths, keep only supported images.
             if isinstance(img_clip, list):
-                img_filepaths = [
+                self.img_filepaths = [
                     filepath
                     for filepath in img_clip
                     if Path(filepath).suffix in bpy.path.extensions_image
                 ]
                 # Don't pack external images by default.
                 # User can chose to pack those references afterwards.
-                pack_image = False
-            # If clipboard contains an image buffer, save it on disk.
+                self.pack_image = False
+            # If clipboard contains an image buffer, save it on disk. Keep the
+            # encoded bytes in memory so packing does not re-read the file.
             elif isinstance(img_clip, Image.Image):
                 name = f"clipboard-{datetime.now().strftime('%Y-%m-%d-%H%M%S')}.png"
                 img_path = os.path.join(tempfile.gettempdir(), name)
-                img_clip.save(img_path)
-                img_filepaths = [img_path]
+                buf = io.BytesIO()
+                img_clip.save(buf, "PNG")
+                self.pack_data = buf.getvalue()
+                with open(img_path, "wb") as img_file:
+                    img_file.write(self.pack_data)
+                self.img_filepaths = [img_path]
 
         except NotImplementedError:
-            self.report({"ERROR"}, "Import from clipboard not supported")
+            self.error = "Import from clipboard not supported"
+
+    def import_references(self, context: bpy.types.Context):
+        """Import the grabbed images as references (main thread only)."""
+        if self.error:
+            self.report({"ERROR"}, self.error)
             return {"CANCELLED"}
 
-        if not img_filepaths:
+        if not self.img_filepaths:
             self.report({"ERROR"}, "No image in clipboard")
             return {"CANCELLED"}
 
+        obj = context.active_object
+        gpd = obj.data
+
+        # Deselect once: imported strokes are created selected.
+        bpy.ops.gpencil.select_all(action="DESELECT")
+
         gpl = gpd.layers.active if gpd.layers.active else gpd.layers.new("References")
         gpd.layers.active = gpl
 
-        for filepath in img_filepaths:
+        for filepath in self.img_filepaths:
             import_image_as_gp_reference(
                 context,
                 obj,
                 filepath,
-                pack_image,
+                self.pack_image,
                 add_new_layer=False,
                 add_new_keyframe=False,
+                pack_data=self.pack_data,
             )
 
         return {"FINISHED"}
 
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        # Grabbing and encoding a large clipboard image is blocking I/O: run
+        # it on a worker thread and poll for completion with an event timer
+        # so the UI stays responsive. Blender data access is not thread-safe,
+        # so the import itself still happens on the main thread.
+        self.error = None
+        self.img_filepaths = []
+        self.pack_image = True
+        self.pack_data = None
+
+        self.worker = threading.Thread(target=self._grab_clipboard, daemon=True)
+        self.worker.start()
+
+        self.timer = context.window_manager.event_timer_add(
+            0.1, window=context.window
+        )
+        context.window_manager.modal_handler_add(self)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event):
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        if self.worker.is_alive():
+            return {"PASS_THROUGH"}
+
+        context.window_manager.event_timer_remove(self.timer)
+        return self.import_references(context)
+
+    def execute(self, context: bpy.types.Context):
+        # Synchronous path for scripted calls.
+        self.error = None
+        self.img_filepaths = []
+        self.pack_image = True
+        self.pack_data = None
+        self._grab_clipboard()
+        return self.import_references(context)
+
 
 class IMPORT_OT_gpencil_references_from_file(bpy.types.Operator, ImportHelper):
     bl_idname = "import.gpencil_references_from_file"
@@ -141,7 +227,8 @@ class IMPORT_OT_gpencil_references_from_file(bpy.types.Operator, ImportHelper):
 
         bpy.ops.gpencil.select_all(action="DESELECT")
 
-        gpd = context.active_object.data
+        obj = context.active_object
+        gpd = obj.data
 
         create_layer = self.create_layer
 
@@ -152,22 +239,48 @@ class IMPORT_OT_gpencil_references_from_file(bpy.types.Operator, ImportHelper):
             gpd.layers.new(self.files[0].name)
             create_layer = False
 
-        for elem in sorted(self.files, key=lambda f: f.name):
-            import_image_as_gp_reference(
+        # View placement is identical for every file: compute it once.
+        view_params = calculate_reference_view_params(context, obj)
+
+        filepaths = [
+            os.path.join(self.directory, elem.name)
+            for elem in sorted(self.files, key=lambda f: f.name)
+        ]
+        if len(filepaths) > 1:
+            prefetch_image_files(filepaths)
+
+        new_strokes = []
+        for filepath in filepaths:
+            gps = import_image_as_gp_reference(
                 context,
-                context.active_object,
-                os.path.join(self.directory, elem.name),
+                obj,
+                filepath,
                 self.pack_image,
                 create_layer,
                 self.as_sequence,
+                view_params=view_params,
+                # Sequence frames each need their own reprojection pass, since
+                # the reproject operator only considers active frames.
+                reproject=self.as_sequence,
             )
 
             # Advance to the next frame
             if self.as_sequence:
                 context.scene.frame_current += 1
+            else:
+                new_strokes.append(gps)
 
         context.scene.frame_current = frame_current
 
+        # Reproject all the new strokes (created selected) to the drawing
+        # plane in one pass.
+        if new_strokes:
+            bpy.ops.gpencil.reproject(
+                type=reprojection_type_map[
+                    context.tool_settings.gpencil_sculpt.lock_axis
+                ]
+            )
+
         return {"FINISHED"}
 
 
@@ -1,6 +1,8 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
+import math
+
 import bgl
 import bpy
 import gpu
@@ -31,6 +33,8 @@ class OverlayDrawer:
         self.color_id = self.format.attr_add(
             id="color", comp_type="F32", len=2, fetch_mode="FLOAT"
         )
+        # Geometry batches cached across redraws (see `draw_circle`).
+        self._batch_cache: dict[tuple, gpu.types.GPUBatch] = {}
 
     def draw(self, coords: list[Vec2f], indices: list[Vec3], color: Vec4f):
         bgl.glEnable(bgl.GL_BLEND)
@@ -68,6 +72,39 @@ class OverlayDrawer:
         batch.draw()
         bgl.glDisable(bgl.GL_BLEND)
 
+    def draw_circle(self, center: Vec2f, color: Vec4f, radius: float, segments: int):
+        """Draw a circle outline centered at `center`.
+
+        The circle geometry is cached per (radius, segments): redraws with
+        unchanged parameters re-submit the same batch instead of
+        re-tessellating the circle every frame.
+
+        :param center: Center of the circle.
+        :param color: Color of the circle.
+        :param radius: Radius of the circle.
+        :param segments: Number of segments of the circle.
+        """
+        key = ("CIRCLE", radius, segments)
+        if not (batch := self._batch_cache.get(key)):
+            angle_step = (2.0 * math.pi) / segments
+            coords = [
+                (
+                    math.cos(i * angle_step) * radius,
+                    math.sin(i * angle_step) * radius,
+                )
+                for i in range(segments + 1)
+            ]
+            batch = batch_for_shader(self.shader, "LINE_STRIP", {"pos": coords})
+            self._batch_cache[key] = batch
+
+        bgl.glEnable(bgl.GL_BLEND)
+        with gpu.matrix.push_pop():
+            gpu.matrix.translate(center)
+            batch.program_set(self.shader)
+            self.shader.uniform_float("color", color)
+            batch.draw()
+        bgl.glDisable(bgl.GL_BLEND)
+
     def draw_rect(self, x: float, y: float, width: float, height: float, color: Vec4f):
         """Draw a filled rectangle, with [x,y] origin at bottom left corner.
 
@@ -6,7 +6,10 @@ import math
 import mathutils
 
 import bpy
-import bpy_extras
+
+
+# Camera forward axis in camera space, frozen so it can be shared safely.
+_CAM_FORWARD = mathutils.Vector((0.0, 0.0, -1.0)).freeze()
 
 
 def get_pixel_size_at_location(
@@ -19,13 +22,16 @@ def get_pixel_size_at_location(
     :returns: The size of a screen pixel at given location.
     """
     rv3d = context.space_data.region_3d
-    p_start = bpy_extras.view3d_utils.region_2d_to_location_3d(
-        context.region, rv3d, (0, 0), loc
-    )
-    p_end = bpy_extras.view3d_utils.region_2d_to_location_3d(
-        context.region, rv3d, (0, 1), loc
-    )
-    return (p_end - p_start).length
+    # One pixel covers 2/(height * P[1][1]) of the view plane in world units
+    # (P[1][1] is the vertical projection scale, including camera zoom),
+    # scaled by the view depth for perspective views. This closed form
+    # replaces two region_2d_to_location_3d calls, each of which inverts the
+    # full view-projection matrix.
+    window_scale_y = rv3d.window_matrix[1][1]
+    if rv3d.is_perspective:
+        depth = -(rv3d.view_matrix @ loc).z
+        return (2.0 * depth) / (context.region.height * window_scale_y)
+    return 2.0 / (context.region.height * window_scale_y)
 
 
 def get_pixel_size_at_object_location(
@@ -42,7 +48,76 @@ def get_pixel_size_at_object_location(
 
 def get_depth_from_view(view_matrix: mathutils.Matrix, obj: bpy.types.Object):
     """Get depth of `obj` from `view matrix`."""
-    return -(view_matrix @ obj.matrix_world).translation.z
+    # Only the z-component of the composed translation is needed: a single
+    # row/translation dot product instead of a full 4x4 matrix multiply.
+    translation = obj.matrix_world.translation
+    row = view_matrix.row[2]
+    return -(
+        row.x * translation.x
+        + row.y * translation.y
+        + row.z * translation.z
+        + row.w
+    )
+
+
+def is_transform_locked(obj: bpy.types.Object) -> bool:
+    """Whether `obj` has any location or scale component locked."""
+    # Tested component-wise to short-circuit without materializing tuples.
+    lock_scale = obj.lock_scale
+    lock_location = obj.lock_location
+    return bool(
+        lock_scale[0]
+        or lock_scale[1]
+        or lock_scale[2]
+        or lock_location[0]
+        or lock_location[1]
+        or lock_location[2]
+    )
+
+
+def compute_depth_matrix(
+    cam_matrix: mathutils.Matrix,
+    base_matrix: mathutils.Matrix,
+    depth: float,
+    adjust_scale: bool = False,
+) -> mathutils.Matrix:
+    """Compute the world matrix placing an object at `depth` from camera,
+    in camera-to-object axis, starting from `base_matrix`.
+
+    :param cam_matrix: The camera world matrix.
+    :param base_matrix: The object world matrix to start from.
+    :param depth: The depth to place the object at.
+    :param adjust_scale: Whether to scale the object to compensate for the translation.
+    :return: The new object world matrix.
+    """
+    view_matrix = cam_matrix.inverted()
+    view_loc = cam_matrix.translation.to_3d()
+    translation = base_matrix.translation
+    # Only the z-component of the view-space translation is needed.
+    row = view_matrix.row[2]
+    current_depth = -(
+        row.x * translation.x + row.y * translation.y + row.z * translation.z + row.w
+    )
+
+    # If object is at camera location, add an initial offset.
+    if abs(current_depth) < sys.float_info.epsilon:
+        current_depth = 1
+        cam_to_obj_vec = cam_matrix @ _CAM_FORWARD
+    else:
+        cam_to_obj_vec = translation.to_3d() - view_loc
+
+    depth_diff_ratio = depth / current_depth
+
+    # Scaling about the camera center amounts to moving the object along the
+    # camera-to-object axis and scaling it uniformly: apply both directly
+    # instead of composing, inverting and decomposing full 4x4 matrices.
+    matrix = base_matrix.copy()
+    if adjust_scale:
+        # Uniform, so it commutes with the rotation: bake it into the basis
+        # by post-multiplying, leaving the translation untouched.
+        matrix @= mathutils.Matrix.Scale(depth_diff_ratio, 4)
+    matrix.translation += cam_to_obj_vec * (depth_diff_ratio - 1.0)
+    return matrix
 
 
 def set_depth_from_camera(
@@ -59,46 +134,40 @@ def set_depth_from_camera(
     :param adjust_scale: Whether to scale to object to compensate for the translation.
     """
     # Don't transform object with location or scale locked.
-    if any(obj.lock_scale[:] + obj.lock_location[:]):
+    if is_transform_locked(obj):
         return
 
-    view_matrix = cam_matrix.inverted()
-    view_loc = cam_matrix.translation.to_3d()
-    current_depth = get_depth_from_view(view_matrix, obj)
+    obj.matrix_world = compute_depth_matrix(
+        cam_matrix, obj.matrix_world, depth, adjust_scale
+    )
 
-    # If object is at camera location, add an initial offset.
-    if abs(current_depth) < sys.float_info.epsilon:
-        current_depth = 1
-        cam_to_obj_vec = cam_matrix @ mathutils.Vector((0, 0, -current_depth))
-    else:
-        cam_to_obj_vec = obj.matrix_world.translation.to_3d() - view_loc
 
-    depth_diff_ratio = depth / current_depth
+# Cached inverted world matrices of cameras, keyed on session pointer.
+# Inverting the 4x4 dominates per-query depth computations; entries are
+# discarded whenever the dependency graph updates.
+_view_matrix_cache: dict[int, mathutils.Matrix] = {}
 
-    # Build transformation matrix to scale from camera center.
-    scale_mat = mathutils.Matrix.Scale(depth_diff_ratio, 4)
-    trans_cam = mathutils.Matrix.Translation(cam_to_obj_vec)
-    transform_mat = trans_cam.inverted() @ scale_mat @ trans_cam
 
-    # Decompose object matrix in:
-    ob_loc, ob_rot, ob_sc = obj.matrix_world.decompose()
-    #  - pre-matrix: scale & rotation
-    pre_matrix = mathutils.Matrix.LocRotScale(mathutils.Vector(), ob_rot, ob_sc)
-    #  - post-matrix: translation
-    post_mat = mathutils.Matrix.Translation(ob_loc)
+@bpy.app.handlers.persistent
+def on_depsgraph_update(*args):
+    """Depsgraph update callback: invalidate cached camera view matrices."""
+    _view_matrix_cache.clear()
 
-    # Compose the full transformation matrix.
-    obj.matrix_world = post_mat @ transform_mat @ pre_matrix
 
-    # Restore local scale if compensation is disabled.
-    if not adjust_scale:
-        obj.scale = ob_sc
+def get_camera_view_matrix(cam: bpy.types.Object) -> mathutils.Matrix:
+    """Get `cam`'s view matrix (inverted world matrix), cached between
+    depsgraph updates."""
+    ptr = cam.as_pointer()
+    view_matrix = _view_matrix_cache.get(ptr)
+    if view_matrix is None:
+        view_matrix = _view_matrix_cache[ptr] = cam.matrix_world.inverted()
+    return view_matrix
 
 
 def camera_view_depth_get(obj: bpy.types.Object) -> float:
     """Get `obj`'s depth from active camera."""
     if cam := bpy.context.scene.camera:
-        return get_depth_from_view(cam.matrix_world.inverted(), obj)
+        return get_depth_from_view(get_camera_view_matrix(cam), obj)
 
     return math.nan
 
@@ -130,9 +199,10 @@ def register():
     #     unit="LENGTH",
     #     options=set(),
     # )
-    pass
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
 
 
 def unregister():
     # del bpy.types.Object.camera_view_depth
-    pass
+    bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    _view_matrix_cache.clear()
@@ -5,9 +5,10 @@ import bpy
 
 from spa_anim2D.layout.core import (
     camera_view_depth_get,
+    compute_depth_matrix,
     deselect_all,
     get_pixel_size_at_object_location,
-    set_depth_from_camera,
+    is_transform_locked,
 )
 
 from spa_anim2D.utils import register_classes, unregister_classes
@@ -57,8 +58,15 @@ class OBJECT_OT_camera_view_push_pull(bpy.types.Operator):
         )
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        # Don't transform object with location or scale locked.
+        if is_transform_locked(context.active_object):
+            return {"CANCELLED"}
+
         self.matrix_orig = context.active_object.matrix_world.copy()
+        # Cache the camera matrix: it does not change during the modal.
+        self.cam_matrix = context.scene.camera.matrix_world.copy()
         self.mouse_y_orig = event.mouse_region_y
+        self.mouse_y_last = event.mouse_region_y
         self.depth_orig = camera_view_depth_get(context.active_object)
         # Get pixel size at object location.
         self.pixel_size = get_pixel_size_at_object_location(
@@ -81,6 +89,17 @@ class OBJECT_OT_camera_view_push_pull(bpy.types.Operator):
             context.window.cursor_modal_restore()
             return {"FINISHED"}
 
+        # Skip the transform update entirely when none of the inputs changed:
+        # modal events also fire for key presses and in-place mouse events,
+        # and each update is a full matrix round-trip on the object.
+        if (
+            event.mouse_region_y == self.mouse_y_last
+            and self.adjust_scale == (not event.ctrl)
+            and self.precision_mode == event.shift
+        ):
+            return {"RUNNING_MODAL"}
+        self.mouse_y_last = event.mouse_region_y
+
         # Disable scaling if ctrl is pressed.
         self.adjust_scale = not event.ctrl
 
@@ -100,17 +119,26 @@ class OBJECT_OT_camera_view_push_pull(bpy.types.Operator):
 
         self.execute(context)
 
+        # Re-sample the sensitivity once the object has moved significantly
+        # in depth: the pixel size captured on invoke no longer matches and
+        # large pushes would otherwise need disproportionate mouse travel.
+        if abs(self.offset) > 0.25 * abs(self.depth_orig):
+            self.pixel_size = get_pixel_size_at_object_location(
+                context, context.active_object
+            )
+            self.depth_orig = camera_view_depth_get(context.active_object)
+            self.mouse_y_orig = event.mouse_region_y
+
         return {"RUNNING_MODAL"}
 
     def execute(self, context: bpy.types.Context):
-        # Start back from initial transformation matrix.
-        # Useful to go back to initial scale if scale compensation has been deactivated.
-        context.active_object.matrix_world = self.matrix_orig
-
-        # Apply depth offset.
-        set_depth_from_camera(
-            context.scene.camera.matrix_world,
-            context.active_object,
+        # Compute the new transform from the initial matrix, so deactivating
+        # scale compensation falls back to the initial scale and each update
+        # is a single RNA matrix write instead of a reset followed by a
+        # re-transform.
+        context.active_object.matrix_world = compute_depth_matrix(
+            self.cam_matrix,
+            self.matrix_orig,
             self.depth_orig + self.offset,
             self.adjust_scale,
         )
@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
+from functools import lru_cache
 from typing import Union
 
 import bpy
@@ -20,40 +21,76 @@ MaterialPalettesRegistry = dict[str, list[bpy.types.Material]]
 # Global material palettes registry
 material_palettes: MaterialPalettesRegistry = {}
 
+# Palette key ordering and name-to-index lookup derived from the registry,
+# used by the material_palette enum get/set functions which Blender polls on
+# every redraw. Kept in sync by `rebuild_palette_lookups`.
+_palette_keys: list[str] = []
+_palette_indices: dict[str, int] = {}
+# Items for the material_palette EnumProperty. Kept as a stable module-level
+# list: Blender requires the item strings to stay referenced on the Python
+# side, and rebuilding them on every enum poll both churns and risks the
+# internal string pointers going stale.
+_palette_enum_items: list[tuple[str, str, str, int]] = []
+
+
+def rebuild_palette_lookups():
+    """Rebuild the palette key list, name-to-index lookup and enum items from
+    the registry."""
+    _palette_keys[:] = material_palettes
+    _palette_indices.clear()
+    _palette_indices.update((key, i) for i, key in enumerate(_palette_keys))
+    # Exclude internal palettes (e.g: palette used for vertex color mode)
+    _palette_enum_items[:] = [
+        (palette, palette, "", i)
+        for i, palette in enumerate(_palette_keys)
+        if palette != VERTEXCOLOR_PALETTE
+    ]
+
+
 # Material names for vertex color painting
 VERTEXCOLOR_PALETTE = "VertexColor"
 VERTEXCOLOR_MAT_LINE = f"{VERTEXCOLOR_PALETTE}/Line"
 VERTEXCOLOR_MAT_FILL = f"{VERTEXCOLOR_PALETTE}/Fill"
 
 
-# The list of attributes to evaluate whether 2 grease pencil materials are similar
+# The list of attributes to evaluate whether 2 grease pencil materials are
+# similar. Most-discriminating scalars come first so pairwise comparisons can
+# bail out before reading the color arrays.
 gp_material_comparison_attributes = (
-    "show_stroke",
     "mode",
     "stroke_style",
-    "color",
+    "fill_style",
+    "show_stroke",
+    "show_fill",
     "use_stroke_holdout",
     "use_overlap_strokes",
-    "show_fill",
-    "fill_style",
-    "fill_color",
     "use_fill_holdout",
+    "color",
+    "fill_color",
 )
 
 
 def clear_material_palettes():
     """Clear the global material palettes registry."""
     material_palettes.clear()
+    rebuild_palette_lookups()
 
 
-def split_material_name(name: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def split_material_name(name: str) -> tuple[str, ...]:
     """
     Split a material name into palette and basename components using
     PALETTE_NAME_SEPARATOR.
 
-    :return: A list with palette name and basename, or basename only if no palette info was found.
+    The result only depends on the name string, so it is memoized: the UI
+    splits the same names several times per material on every redraw.
+
+    :return: A tuple with palette name and basename, or basename only if no palette info was found.
     """
-    return name.split(PALETTE_NAME_SEPARATOR, 1)
+    # `partition` does a single C-level scan without the list allocation of
+    # `split`.
+    head, sep, tail = name.partition(PALETTE_NAME_SEPARATOR)
+    return (head, tail) if sep else (name,)
 
 
 def get_palette_name(material: bpy.types.Material) -> Union[str, None]:
@@ -111,58 +148,100 @@ def are_similar_gp_materials(
     if not materialA.is_grease_pencil or not materialB.is_grease_pencil:
         raise ValueError("This method only works on grease pencil materials")
 
+    gp_a = materialA.grease_pencil
+    gp_b = materialB.grease_pencil
     for attr in gp_material_comparison_attributes:
-        attrA = getattr(materialA.grease_pencil, attr)
-        attrB = getattr(materialB.grease_pencil, attr)
+        attrA = getattr(gp_a, attr)
+        attrB = getattr(gp_b, attr)
         # Turn bpy_prop_array into lists for equality test to work on values
         if isinstance(attrA, bpy.types.bpy_prop_array):
-            attrA = attrA[:]
-            attrB = attrB[:]
-
-        if attrA != attrB:
+            if attrA[:] != attrB[:]:
+                return False
+        elif attrA != attrB:
             return False
 
     return True
 
 
-def cleanup_duplicated_materials():
-    """Remove duplicated grease pencil materials to keep only unique instances."""
+def get_gp_material_fingerprint(material: bpy.types.Material) -> tuple:
+    """Return a hashable fingerprint of the attributes used to compare
+    grease pencil materials (see `gp_material_comparison_attributes`).
+
+    Materials with equal fingerprints are similar in the sense of
+    `are_similar_gp_materials`.
+
+    :param material: The grease pencil material to consider.
+    :return: The fingerprint tuple.
+    """
+    gp = material.grease_pencil
+    values = []
+    for attr in gp_material_comparison_attributes:
+        value = getattr(gp, attr)
+        # Turn bpy_prop_array into tuples to make them hashable
+        if isinstance(value, bpy.types.bpy_prop_array):
+            value = tuple(value)
+        values.append(value)
+    return tuple(values)
+
+
+def cleanup_duplicated_materials(
+    materials: list[bpy.types.Material] = None,
+) -> set[int]:
+    """Remove duplicated grease pencil materials to keep only unique instances.
+
+    :param materials: The local grease pencil materials to consider;
+                      collected from bpy.data if not provided.
+    :return: The session pointers of the removed materials.
+    """
+    if materials is None:
+        # NOTE: Cleanup can only affect local materials.
+        materials = get_grease_pencil_materials(only_local=True)
+
     similar_material_candidates: dict[str, list[bpy.types.Material]] = {}
 
     # First pass: create groups of potientially similar materials by name.
     # Group materials with the same "short name" (name without any auto-numbering suffix).
-    # NOTE: Cleanup can only affect local materials.
-    for mat in get_grease_pencil_materials(only_local=True):
-        short_name = remove_auto_numbering_suffix(mat.name)
-        if not get_palette_name(mat):
+    for mat in materials:
+        name = mat.name
+        # Discard materials without a palette component, testing the raw name
+        # directly instead of re-splitting it.
+        if name.find(PALETTE_NAME_SEPARATOR) < 1:
             continue
-        if short_name not in similar_material_candidates:
-            similar_material_candidates[short_name] = []
-        similar_material_candidates[short_name].append(mat)
+        short_name = remove_auto_numbering_suffix(name)
+        similar_material_candidates.setdefault(short_name, []).append(mat)
 
     # Second pass: find similar materials within those groups.
-    orphan_mats = set()
+    # A plain list is enough here: the bucket scan below visits each material
+    # exactly once, so no membership test (and no RNA wrapper hashing) needed.
+    orphan_mats = []
     # Iterate over material groups
-    for materials in similar_material_candidates.values():
+    for group_materials in similar_material_candidates.values():
         # If only one material in this group, nothing to do (no duplicates)
-        if len(materials) == 1:
+        if len(group_materials) == 1:
             continue
-        # Iterate over each material in this group
-        for i, matA in enumerate(materials):
-            # If a material has already been considered as a duplicate, skip it.
-            if matA in orphan_mats:
-                continue
-            # Compare this material "A" to all the next ones in the list
-            for matB in materials[i + 1 :]:
-                # If another material "B" is similar to "A", remap users of "B" to "A".
-                # Mark "B" as orphaned by this process.
-                if are_similar_gp_materials(matA, matB):
-                    matB.user_remap(matA)
-                    orphan_mats.add(matB)
+        # Bucket materials on their parameter fingerprint: this reads each
+        # material's attributes once, instead of once per pair as a nested
+        # similarity scan would.
+        buckets: dict[tuple, bpy.types.Material] = {}
+        for mat in group_materials:
+            fingerprint = get_gp_material_fingerprint(mat)
+            if (original := buckets.get(fingerprint)) is not None:
+                # Another material with identical values already exists:
+                # remap users of this one to it and mark it as orphaned.
+                mat.user_remap(original)
+                orphan_mats.append(mat)
+            else:
+                buckets[fingerprint] = mat
+
+    # Capture pointers before removal: the Python wrappers of removed
+    # datablocks cannot be accessed afterwards.
+    orphan_ptrs = {mat.as_pointer() for mat in orphan_mats}
 
     # Finally, remove all materials orphaned by the cleanup process.
     bpy.data.batch_remove(orphan_mats)
 
+    return orphan_ptrs
+
 
 def refresh_palettes(cleanup_materials: bool = False):
     """
@@ -174,15 +253,31 @@ def refresh_palettes(cleanup_materials: bool = False):
     if not isinstance(bpy.data, bpy.types.BlendData):
         return
 
+    # Collect grease pencil materials in a single pass over bpy.data, instead
+    # of one scan for the cleanup and another one for the registry.
+    gp_materials = []
+    local_gp_materials = []
+    for mat in bpy.data.materials:
+        if mat.is_grease_pencil:
+            gp_materials.append(mat)
+            if not mat.library:
+                local_gp_materials.append(mat)
+
     # Clean duplicated materials
     if cleanup_materials:
-        cleanup_duplicated_materials()
+        # Capture pointers first: wrappers of the datablocks removed by the
+        # cleanup cannot be accessed anymore afterwards.
+        gp_material_ptrs = [(mat, mat.as_pointer()) for mat in gp_materials]
+        orphan_ptrs = cleanup_duplicated_materials(local_gp_materials)
+        gp_materials = [
+            mat for mat, ptr in gp_material_ptrs if ptr not in orphan_ptrs
+        ]
 
     # Initialize default palette
     material_palettes[DEFAULT_PALETTE_ID] = []
 
     # Iterate over grease pencil materials and fill the material palettes registry
-    for mat in get_grease_pencil_materials():
+    for mat in gp_materials:
         palette = get_palette_name(mat)
         # Discard material without palette info in their names
         if not palette:
@@ -195,6 +290,8 @@ def refresh_palettes(cleanup_materials: bool = False):
             material_palettes[palette] = []
         material_palettes[palette].append(mat)
 
+    rebuild_palette_lookups()
+
     if cleanup_materials:
         # Re-assign palette materials to grease pencil objects
         for gp in bpy.data.grease_pencils:
@@ -206,24 +303,34 @@ def assign_active_palette_materials(gpencil: bpy.types.GreasePencil):
 
     :param gpencil: The grease pencil data to assign materials to.
     """
+    # Read the active palette once: the property getter resolves the stored
+    # string through the registry on every access.
+    palette = gpencil.material_palette
     # Switch back to default palette if active palette is not valid anymore.
     # This could happen if all materials from a palette have been deleted after
     # the previous palettes registry refresh.
-    if gpencil.material_palette not in material_palettes:
+    if palette not in material_palettes:
         gpencil.material_palette = DEFAULT_PALETTE_ID
         return
 
-    # Assign new materials
-    for mat in material_palettes[gpencil.material_palette]:
-        if mat not in gpencil.materials.values():
+    # Assign new materials.
+    # Build the assigned set once: testing against gpencil.materials.values()
+    # would rebuild and scan the slot list for every palette entry.
+    assigned = {mat for mat in gpencil.materials if mat is not None}
+    for mat in material_palettes[palette]:
+        if mat not in assigned:
             gpencil.materials.append(mat)
+            assigned.add(mat)
 
 
 @bpy.app.handlers.persistent
 def on_load_pre(*args):
     """File load_pre callback."""
+    global _vertex_mats_initialized
     # Clear the material palettes registry to avoid keeping refs to material datablocks
     clear_material_palettes()
+    # The default vertex color materials do not carry over to the next file.
+    _vertex_mats_initialized = False
 
 
 @bpy.app.handlers.persistent
@@ -233,10 +340,31 @@ def on_load_post(*args):
     refresh_palettes()
 
 
+# Whether a palette refresh triggered by undo/redo is already pending.
+_palette_refresh_pending = False
+
+
+def apply_pending_palette_refresh():
+    """Timer callback applying a coalesced palette registry refresh."""
+    global _palette_refresh_pending
+    _palette_refresh_pending = False
+    refresh_palettes()
+
+
 @bpy.app.handlers.persistent
 def on_undo_redo(*args):
     """Undo-redo callback."""
-    refresh_palettes()
+    global _palette_refresh_pending
+    # Undo and redo can fire several events in a row: coalesce the registry
+    # rebuilds into a single one on the next event loop iteration.
+    # NOTE: timer functions are not consumed in background mode (see
+    # `register`), so refresh synchronously there.
+    if bpy.app.background:
+        refresh_palettes()
+        return
+    if not _palette_refresh_pending:
+        _palette_refresh_pending = True
+        bpy.app.timers.register(apply_pending_palette_refresh, first_interval=0)
 
 
 def set_material_palette_value(self, index: int):
@@ -244,18 +372,18 @@ def set_material_palette_value(self, index: int):
     # Store the enum value for current palette as its string value (instead of int).
     # This is to avoid the enum index value getting out of sync with the content
     # of the material palettes registry.
-    self["material_palette_str"] = list(material_palettes)[index]
+    self["material_palette_str"] = _palette_keys[index]
 
 
 def get_material_palette_value(self):
     """GreasePencil.material_palette get function."""
     if "material_palette_str" in self:
-        try:
-            # Compute enum index using palette name index in material palettes registry
-            return list(material_palettes).index(self["material_palette_str"])
-        except ValueError:
-            # Fallback to default palette if the stored one is not found
-            self["material_palette_str"] = DEFAULT_PALETTE_ID
+        # Compute enum index using palette name index in material palettes registry
+        index = _palette_indices.get(self["material_palette_str"])
+        if index is not None:
+            return index
+        # Fallback to default palette if the stored one is not found
+        self["material_palette_str"] = DEFAULT_PALETTE_ID
     return 0
 
 
@@ -272,13 +400,8 @@ def get_material_palettes_enum_items(self, context):
     if not material_palettes:
         refresh_palettes()
 
-    # Return currently registered palettes except for the internal ones
-    # (e.g: palette used for vertex color mode)
-    return (
-        (palette, palette, "", i)
-        for i, palette in enumerate(material_palettes)
-        if palette != VERTEXCOLOR_PALETTE
-    )
+    # Return the cached items list (rebuilt with the registry).
+    return _palette_enum_items
 
 
 def initialize_palettes():
@@ -287,8 +410,18 @@ def initialize_palettes():
         refresh_palettes()
 
 
+# Whether the default vertex color materials have been created this session.
+# Avoids re-scanning bpy.data.materials on every style update; reset on file
+# load (see `on_load_pre`).
+_vertex_mats_initialized = False
+
+
 def init_vertex_color_materials():
     """Initialize default materials for vertex color painting"""
+    global _vertex_mats_initialized
+    if _vertex_mats_initialized:
+        return
+
     # Simple line material
     if not bpy.data.materials.get(VERTEXCOLOR_MAT_LINE):
         line = bpy.data.materials.new(VERTEXCOLOR_MAT_LINE)
@@ -305,6 +438,8 @@ def init_vertex_color_materials():
         fill.grease_pencil.show_stroke = False
         fill.grease_pencil.show_fill = True
 
+    _vertex_mats_initialized = True
+
 
 class PaintColorSettings(bpy.types.PropertyGroup):
     def mode_update_cb(self, context: bpy.types.Context):
@@ -337,16 +472,21 @@ class PaintColorSettings(bpy.types.PropertyGroup):
     def vertex_color_style_update_cb(self, context):
         scene = self.id_data
         gp_settings = scene.tool_settings.gpencil_paint.brush.gpencil_settings
-        # Initialize vertex color materials if necessary
-        if not bpy.data.materials.get(self.vertex_color_style):
+        # Initialize vertex color materials if necessary. A failed lookup
+        # means the default materials are gone (fresh file or deleted by the
+        # user): drop the cached initialization state and recreate them.
+        material = bpy.data.materials.get(self.vertex_color_style)
+        if material is None:
+            global _vertex_mats_initialized
+            _vertex_mats_initialized = False
             init_vertex_color_materials()
+            material = bpy.data.materials.get(self.vertex_color_style)
         # Ensure material pin is activated
         if self.mode == "VERTEXCOLOR":
             if not gp_settings.use_material_pin:
                 gp_settings.use_material_pin = True
             # Use vertex mode impacts both stroke and fill
             gp_settings.vertex_mode = "BOTH"
-        material = bpy.data.materials.get(self.vertex_color_style)
         # Set the pinned material to match the current paint style
         if gp_settings.material != material:
             gp_settings.material = material
@@ -7,12 +7,32 @@ from spa_anim2D.materials.core import (
     DEFAULT_PALETTE_ID,
     get_material_basename,
     get_palette_name,
-    has_valid_palette_name,
+    material_palettes,
 )
 
 from spa_anim2D.utils import register_classes, unregister_classes
 
 
+# Cache of `filter_items` results keyed on the owning object's session pointer.
+# The filter runs on every area redraw, even when the panel is not visible, so
+# recomputing it only when its inputs change saves a full pass over the
+# material slots per redraw.
+_filter_cache: dict[int, tuple] = {}
+_filter_cache_version = 0
+
+# The material list never reorders items: share one empty list instead of
+# allocating a fresh one per redraw.
+_EMPTY_ORDER: list = []
+
+
+@bpy.app.handlers.persistent
+def on_depsgraph_update(*args):
+    """Depsgraph update callback: invalidate cached material filter results."""
+    global _filter_cache_version
+    _filter_cache_version += 1
+    _filter_cache.clear()
+
+
 class MATERIAL_UL_palette_materials(bpy.types.UIList):
     """
     Template to display the materials of a grease pencil's active material_palette.
@@ -55,30 +75,46 @@ class MATERIAL_UL_palette_materials(bpy.types.UIList):
 
     def filter_items(self, context: bpy.types.Context, obj, propname):
         mat_slots = getattr(obj, propname)
-        materials = [slot.material for slot in mat_slots]
-
-        flt_flags = []
-        flt_neworder = []
-
-        active_palette = getattr(obj.data, "material_palette")
-        flt_flags = [0] * len(materials)
-
-        for i, mat in enumerate(materials):
+        active_palette = obj.data.material_palette
+
+        # Return the cached result when nothing impacting the filter changed
+        # since the last computation (see `_filter_cache`).
+        cache_key = (_filter_cache_version, active_palette, len(mat_slots))
+        cached = _filter_cache.get(obj.as_pointer())
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        flt_flags = [0] * len(mat_slots)
+
+        is_default_palette = active_palette == DEFAULT_PALETTE_ID
+        bit = self.bitflag_filter_item
+
+        # Single pass over the slots: dedupe through a set of session pointers
+        # and split each material name only once, instead of rescanning the
+        # preceding slots for every item. This runs on every redraw.
+        seen: set[int] = set()
+        for i, slot in enumerate(mat_slots):
+            mat = slot.material
             # Discard slots without materials
             if not mat:
                 continue
             # Discard slot if one with the same material is already displayed
-            if mat in materials[:i]:
+            ptr = mat.as_pointer()
+            if ptr in seen:
                 continue
+            seen.add(ptr)
             # Display materials from either:
             # - the active material_palette
-            # - all materials without a valid palette if material_palette is the default placeholder
-            if (get_palette_name(mat) == active_palette) or (
-                active_palette == DEFAULT_PALETTE_ID and not has_valid_palette_name(mat)
+            # - all materials without a valid palette if material_palette is
+            #   the default placeholder
+            palette = get_palette_name(mat)
+            if palette == active_palette or (
+                is_default_palette and palette not in material_palettes
             ):
-                flt_flags[i] = self.bitflag_filter_item
+                flt_flags[i] = bit
 
-        return flt_flags, flt_neworder
+        _filter_cache[obj.as_pointer()] = (cache_key, (flt_flags, _EMPTY_ORDER))
+        return flt_flags, _EMPTY_ORDER
 
 
 class VIEW3D_PT_MaterialPalettePanel(bpy.types.Panel):
@@ -171,6 +207,11 @@ classes = (
 def register():
     register_classes(classes)
 
+    bpy.app.handlers.depsgraph_update_post.append(on_depsgraph_update)
+
 
 def unregister():
     unregister_classes(classes)
+
+    bpy.app.handlers.depsgraph_update_post.remove(on_depsgraph_update)
+    _filter_cache.clear()
@@ -20,6 +20,10 @@ BlenderOperatorTypeClass = Type[bpy.types.Operator]
 
 log = logging.getLogger(__name__)
 
+# Blender's auto numbering suffix (e.g. ".001"), compiled once instead of
+# going through the regex cache on every call.
+_AUTO_NUMBERING_SUFFIX_RE = re.compile(r".\d{3}$")
+
 
 def register_classes(classes: tuple[BlenderTypeClass, ...]):
     """
@@ -100,7 +104,7 @@ def remove_auto_numbering_suffix(name: str) -> str:
     :param name: The name to consider
     :return: The name without numbering suffix if any
     """
-    return re.sub(r".\d{3}$", "", name)
+    return _AUTO_NUMBERING_SUFFIX_RE.sub("", name)
 
 
 def get_addon_directory() -> str:
@@ -12,20 +12,31 @@ from spa_anim2D.animation.core import (
 )
 
 
+def get_frame_numbers(frames) -> list[int]:
+    """Return the frame numbers of the given keyframes as a plain list."""
+    return [f.frame_number for f in frames]
+
+
 @pytest.fixture()
 def gp_object() -> bpy.types.Object:
-    # Setup a Grease Pencil object with some (empty) keyframes
-    bpy.ops.object.gpencil_add(type="EMPTY")
-    gp_object = bpy.context.active_object
-    gp_object.data.clear()
-    gp_object.data.layers.new(name="TestLayer", set_active=True)
+    # Setup an empty Grease Pencil object with an active layer.
+    # Built through the data API directly: the add operator carries poll
+    # checks, an undo push and viewport tagging the tests do not need.
+    gpd = bpy.data.grease_pencils.new("GP")
+    gpd.layers.new(name="TestLayer", set_active=True)
+    gp_object = bpy.data.objects.new("GP", gpd)
+    bpy.context.scene.collection.objects.link(gp_object)
+    bpy.context.view_layer.objects.active = gp_object
+    gp_object.select_set(True)
     return gp_object
 
 
 @pytest.fixture()
 def keyframed_gp_A(gp_object) -> tuple[bpy.types.Object, list[int]]:
     keyframes = [3, 4, 5, 7, 9, 12]
-    for keyframe in keyframes:
+    # Insert in descending order: each frames.new call then prepends at the
+    # head of the frame list instead of searching for its insertion point.
+    for keyframe in sorted(keyframes, reverse=True):
         gp_object.data.layers.active.frames.new(keyframe)
 
     return gp_object, keyframes
@@ -43,11 +54,14 @@ def test_shift_gp_keyframes_positive_offset(keyframed_gp_A):
     shift_gp_keyframes(gp_object.data, frame_start, offset)
 
     split_idx = bisect.bisect(base_keyframes, frame_start)
-    pre_keys, post_keys = gp_layer.frames[:split_idx], gp_layer.frames[split_idx:]
+    frames = gp_layer.frames
+    pre_keys, post_keys = frames[:split_idx], frames[split_idx:]
     # Keyframes <= frame_start shouldn't have changed
-    assert [f.frame_number for f in pre_keys] == base_keyframes[:split_idx]
+    assert get_frame_numbers(pre_keys) == base_keyframes[:split_idx]
     # Keyframes > frame_start should have been shifted
-    assert [f.frame_number - offset for f in post_keys] == base_keyframes[split_idx:]
+    assert get_frame_numbers(post_keys) == [
+        k + offset for k in base_keyframes[split_idx:]
+    ]
 
 
 def test_shift_gp_keyframes_non_applicable_negative_offset(keyframed_gp_A):
@@ -63,7 +77,7 @@ def test_shift_gp_keyframes_non_applicable_negative_offset(keyframed_gp_A):
 
     # Offset is not applicable, no keys should have been impacted
     assert not keys
-    assert [f.frame_number for f in gp_layer.frames] == base_keyframes
+    assert get_frame_numbers(gp_layer.frames) == base_keyframes
 
 
 def test_shift_gp_keyframes_active_layer_only(keyframed_gp_A):
@@ -84,9 +98,10 @@ def test_shift_gp_keyframes_active_layer_only(keyframed_gp_A):
     )
 
     # Only frames on the active layer should have changed
-    assert len(keys) == len(active_layer.frames)
-    assert [f.frame_number for f in gp_layer.frames] == base_keyframes
-    assert [f.frame_number - offset for f in active_layer.frames] == base_keyframes
+    active_frames = active_layer.frames
+    assert len(keys) == len(active_frames)
+    assert get_frame_numbers(gp_layer.frames) == base_keyframes
+    assert get_frame_numbers(active_frames) == [k + offset for k in base_keyframes]
 
 
 def test_shift_gp_keyframes_unlocked_layers_only(keyframed_gp_A):
@@ -108,9 +123,10 @@ def test_shift_gp_keyframes_unlocked_layers_only(keyframed_gp_A):
     )
 
     # Only frames on the unlocked layer should have changed
-    assert len(keys) == len(gp_layer.frames)
-    assert [f.frame_number for f in locked_layer.frames] == base_keyframes
-    assert [f.frame_number - offset for f in gp_layer.frames] == base_keyframes
+    frames = gp_layer.frames
+    assert len(keys) == len(frames)
+    assert get_frame_numbers(locked_layer.frames) == base_keyframes
+    assert get_frame_numbers(frames) == [k + offset for k in base_keyframes]
 
 
 def test_shift_gp_keyframes_active_and_unlocked_layers_only(keyframed_gp_A):
@@ -137,8 +153,8 @@ def test_shift_gp_keyframes_active_and_unlocked_layers_only(keyframed_gp_A):
 
     # This combination of settings should not change anything: the active layer is locked
     assert not keys
-    assert [f.frame_number for f in locked_layer.frames] == base_keyframes
-    assert [f.frame_number for f in gp_layer.frames] == base_keyframes
+    assert get_frame_numbers(locked_layer.frames) == base_keyframes
+    assert get_frame_numbers(gp_layer.frames) == base_keyframes
 
 
 def test_gp_create_new_duplicated_frames_no_keyframes(gp_object):
@@ -198,8 +214,8 @@ def test_gp_create_new_duplicated_frames_before_first(gp_object):
 
 def test_gp_create_new_duplicated_frames_complicated(gp_object):
     gpl: bpy.types.GPencilLayer = gp_object.data.layers[0]
-    gpf3 = gpl.frames.new(3)
     gpf6 = gpl.frames.new(6)
+    gpf3 = gpl.frames.new(3)
 
     frame_numbers = [1, 2, 4, 5, 6, 7]
     frames_to_duplicate = gp_compute_list_of_frames_to_duplicate(gpl, frame_numbers)
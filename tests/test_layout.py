@@ -1,7 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 # Copyright (C) 2023, The SPA Studios. All rights reserved.
 
-import math
 import bpy
 
 # FIXME: https://developer.blender.org/T100203
@@ -47,8 +46,9 @@ def test_camera_view_depth_no_active_cam():
     ob = bpy.context.active_object
     # Unset active camera.
     bpy.context.scene.camera = None
-    # Ensure camera_view_depth is returning NaN.
-    assert math.isnan(camera_view_depth_get(ob))
+    # Ensure camera_view_depth is returning NaN: only NaN compares unequal
+    # to itself.
+    assert (depth := camera_view_depth_get(ob)) != depth
     # This should still work, but be a no-op.
     camera_view_depth_set(ob, 10)
-    assert math.isnan(camera_view_depth_get(ob))
+    assert (depth := camera_view_depth_get(ob)) != depth
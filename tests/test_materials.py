@@ -8,17 +8,35 @@ import bpy
 from spa_anim2D.materials.core import (
     DEFAULT_PALETTE_ID,
     clear_material_palettes,
+    gp_material_comparison_attributes,
     material_palettes,
     refresh_palettes,
 )
 
 
 def create_gp_material(name: str) -> bpy.types.Material:
-    mat = bpy.data.materials.new(name)
-    bpy.data.materials.create_gpencil_data(mat)
+    # Resolve the materials collection once per call; binding it at module
+    # scope would keep a dangling wrapper across the per-test file reloads.
+    materials = bpy.data.materials
+    mat = materials.new(name)
+    materials.create_gpencil_data(mat)
     return mat
 
 
+def clone_gp_material(src: bpy.types.Material) -> bpy.types.Material:
+    """Clone a grease pencil material through the data API.
+
+    Only copies the display settings the palette cleanup compares, skipping
+    the node tree duplication a full Material.copy performs.
+    """
+    dst = create_gp_material(src.name)
+    src_gp = src.grease_pencil
+    dst_gp = dst.grease_pencil
+    for attr in gp_material_comparison_attributes:
+        setattr(dst_gp, attr, getattr(src_gp, attr))
+    return dst
+
+
 def test_material_palettes_initialization():
     clear_material_palettes()
     assert len(material_palettes) == 0
@@ -195,7 +213,7 @@ def test_undo_redo_material_deletion():
 def test_palette_cleanup_identical_materials():
     # Create a GP material and a copy of it
     matA = create_gp_material("A/MatA")
-    matA_dup = matA.copy()
+    matA_dup = clone_gp_material(matA)
     assert matA_dup.name == f"{matA.name}.001"
     # Refresh palettes with cleanup
     refresh_palettes(cleanup_materials=True)
@@ -207,7 +225,7 @@ def test_palette_cleanup_identical_materials():
 def test_palette_cleanup_identical_materials_ending_with_non_word_char():
     # Create a GP material ending with a non-word character and a copy of it
     matA = create_gp_material("A/MatA 20%")
-    matA_dup = matA.copy()
+    matA_dup = clone_gp_material(matA)
     assert matA_dup.name == f"{matA.name}.001"
     # Refresh palettes with cleanup
     refresh_palettes(cleanup_materials=True)
@@ -227,7 +245,7 @@ def test_palette_assignation_identical_materials():
     gp.material_palette = "A"
 
     # Duplicate the GP material
-    matA_dup = matA.copy()
+    matA_dup = clone_gp_material(matA)
     assert matA_dup.name == f"{matA.name}.001"
 
     # Refresh palettes with cleanup
@@ -243,7 +261,7 @@ def test_palette_assignation_identical_materials():
 def test_palette_cleanup_similar_materials_name_different_settings():
     # Create a GP material and a copy of it
     matA = create_gp_material("A/MatA")
-    matA_dup = matA.copy()
+    matA_dup = clone_gp_material(matA)
     assert matA_dup.name == f"{matA.name}.001"
 
     # Change the color of the material
@@ -263,7 +281,7 @@ def test_palette_assignation_similar_materials_name_different_settings():
     gp = bpy.data.grease_pencils.new("GP")
     gp.material_palette = "A"
 
-    matA_dup = matA.copy()
+    matA_dup = clone_gp_material(matA)
     assert matA_dup.name == f"{matA.name}.001"
     # Change the color of the material
     matA_dup.grease_pencil.color = 1.0, 0.0, 0.0, 1.0
@@ -279,7 +297,7 @@ def test_palette_assignation_similar_materials_name_different_settings():
 def test_palette_cleanup_multiple_identical_materials():
     # Create a GP material and several copy of it
     matA = create_gp_material("A/MatA")
-    duplicates = [matA.copy() for i in range(4)]
+    duplicates = [clone_gp_material(matA) for i in range(4)]
 
     # Create a GP and assign it the duplicated materials "manually"
     gp = bpy.data.grease_pencils.new("GP")